@@ -12,7 +12,7 @@ from homeassistant.components.alarm_control_panel import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import STATE_UNAVAILABLE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -21,6 +21,22 @@ from .coordinator import IntelbrasAlarmCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# (alarm, armed, partial_armed) -> state. alarm and partial_armed are only
+# checked for True; armed keeps None so an unknown state maps to None.
+# Precedence matches the panel: triggered > armed away > armed home > disarmed.
+_STATE_MAP: dict[tuple[bool, bool | None, bool], AlarmControlPanelState] = {
+    **{
+        (True, armed, partial): AlarmControlPanelState.TRIGGERED
+        for armed in (True, False, None)
+        for partial in (True, False)
+    },
+    (False, True, True): AlarmControlPanelState.ARMED_AWAY,
+    (False, True, False): AlarmControlPanelState.ARMED_AWAY,
+    (False, False, True): AlarmControlPanelState.ARMED_HOME,
+    (False, None, True): AlarmControlPanelState.ARMED_HOME,
+    (False, False, False): AlarmControlPanelState.DISARMED,
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -42,6 +58,8 @@ class IntelbrasAlarmControlPanel(CoordinatorEntity, AlarmControlPanelEntity):
     # No user code required - authentication handled at connection level
     _attr_code_arm_required = False
     _attr_code_disarm_required = False
+    _attr_available = False
+    _attr_extra_state_attributes: dict[str, Any] = {}
 
     def __init__(self, coordinator: IntelbrasAlarmCoordinator) -> None:
         """Initialize the alarm control panel."""
@@ -49,44 +67,56 @@ class IntelbrasAlarmControlPanel(CoordinatorEntity, AlarmControlPanelEntity):
         self.coordinator: IntelbrasAlarmCoordinator = coordinator
 
         # Set unique ID
-        device_id = list(coordinator.device_identifiers)[0][1]
-        self._attr_unique_id = f"{device_id}_alarm_panel"
+        self._attr_unique_id = coordinator.entity_unique_id("alarm_panel")
 
         # Set device info
         self._attr_device_info = coordinator.device_info
 
-    @property
-    def alarm_state(self) -> AlarmControlPanelState | None:
-        """Return the state of the alarm control panel."""
-        if not self.coordinator.last_update_success:
-            return None
+        self._update_from_coordinator()
 
-        # Check if connection is disabled
-        if self.coordinator.data and self.coordinator.data.get("status", {}).get("connection_disabled", False):
-            return None
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute entity state from the latest coordinator data."""
+        self._update_from_coordinator()
+        self.async_write_ha_state()
 
-        alarm_status = self.coordinator.get_alarm_status()
+    def _update_from_coordinator(self) -> None:
+        """Populate the cached entity attributes from coordinator data."""
+        data = self.coordinator.data
+        if not data:
+            # No data yet (startup) - entity is unavailable, skip all parsing
+            self._attr_available = False
+            self._attr_alarm_state = None
+            self._attr_extra_state_attributes = {}
+            return
 
-        # Handle None values when disconnected
-        if alarm_status["alarm"] is True:
-            return AlarmControlPanelState.TRIGGERED
-        elif alarm_status["armed"] is True:
-            return AlarmControlPanelState.ARMED_AWAY
-        elif alarm_status["partial_armed"] is True:
-            return AlarmControlPanelState.ARMED_HOME
-        elif alarm_status["armed"] is False:
-            return AlarmControlPanelState.DISARMED
-        else:
-            return None  # Unknown state when values are None
+        status = data.get("status", {})
+        connection_disabled = status.get("connection_disabled", False)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        if not self.coordinator.data:
-            return {}
+        # Entity is unavailable when connection is disabled
+        self._attr_available = not connection_disabled and self.coordinator.last_update_success
+        self._attr_alarm_state = self._compute_alarm_state(connection_disabled)
+        self._attr_extra_state_attributes = self._compute_extra_state_attributes(status)
 
-        status = self.coordinator.data.get("status", {})
+    def _compute_alarm_state(self, connection_disabled: bool) -> AlarmControlPanelState | None:
+        """Return the state of the alarm control panel."""
+        if not self.coordinator.last_update_success or connection_disabled:
+            return None
 
+        alarm_status = self.coordinator.get_alarm_status()
+        armed = alarm_status["armed"]
+
+        # Unknown combinations (values are None when disconnected) map to None
+        return _STATE_MAP.get(
+            (
+                alarm_status["alarm"] is True,
+                armed if armed is True or armed is False else None,
+                alarm_status["partial_armed"] is True,
+            )
+        )
+
+    def _compute_extra_state_attributes(self, status: dict[str, Any]) -> dict[str, Any]:
+        """Return the state attributes."""
         attributes = {
             "armed": status.get("armed", False),
             "partial_armed": status.get("partial_armed", False),
@@ -94,11 +124,16 @@ class IntelbrasAlarmControlPanel(CoordinatorEntity, AlarmControlPanelEntity):
             "panel_info": self.coordinator.panel_info,
         }
 
-        # Add zone information
-        zones = status.get("zones", [])
-        active_zones = [zone["name"] for zone in zones if zone.get("active")]
-        bypassed_zones = [zone["name"] for zone in zones if zone.get("bypassed")]
-        alarm_zones = [zone["name"] for zone in zones if zone.get("alarm")]
+        # Add zone information (single pass over the zone list)
+        active_zones, bypassed_zones, alarm_zones = [], [], []
+        for zone in status.get("zones", []):
+            name = zone["name"]
+            if zone.get("active"):
+                active_zones.append(name)
+            if zone.get("bypassed"):
+                bypassed_zones.append(name)
+            if zone.get("alarm"):
+                alarm_zones.append(name)
 
         if active_zones:
             attributes["active_zones"] = active_zones
@@ -108,16 +143,8 @@ class IntelbrasAlarmControlPanel(CoordinatorEntity, AlarmControlPanelEntity):
             attributes["alarm_zones"] = alarm_zones
 
         # Add recent events
-        events = self.coordinator.get_events(3)
-        if events:
-            attributes["recent_events"] = [
-                {
-                    "description": event.get("description", "Unknown event"),
-                    "timestamp": event.get("timestamp", "Unknown"),
-                    "type": event.get("type", "unknown"),
-                }
-                for event in events
-            ]
+        if events := self.coordinator.get_events(3):
+            attributes["recent_events"] = events
 
         return attributes
 
@@ -145,8 +172,5 @@ class IntelbrasAlarmControlPanel(CoordinatorEntity, AlarmControlPanelEntity):
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        # Entity is unavailable when connection is disabled
-        if self.coordinator.data and self.coordinator.data.get("status", {}).get("connection_disabled", False):
-            return False
-
-        return self.coordinator.last_update_success and self.coordinator.data is not None
+        # CoordinatorEntity overrides available, so expose the cached flag
+        return self._attr_available
@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 import logging
-from typing import Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
+    BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -20,6 +21,29 @@ from .coordinator import IntelbrasAlarmCoordinator
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class IntelbrasBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """Describes an Intelbras binary sensor."""
+
+    status_key: str
+
+
+BINARY_SENSORS: tuple[IntelbrasBinarySensorEntityDescription, ...] = (
+    IntelbrasBinarySensorEntityDescription(
+        key="connection",
+        name="Connection",
+        device_class=BinarySensorDeviceClass.CONNECTIVITY,
+        status_key="connected",
+    ),
+    IntelbrasBinarySensorEntityDescription(
+        key="alarm",
+        name="Alarm",
+        device_class=BinarySensorDeviceClass.SAFETY,
+        status_key="alarm",
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -28,54 +52,34 @@ async def async_setup_entry(
     """Set up Intelbras binary sensors based on a config entry."""
     coordinator: IntelbrasAlarmCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities: list[BinarySensorEntity] = []
-
     # Add system status binary sensors
-    entities.extend(
-        [
-            IntelbrasConnectionSensor(coordinator),
-            IntelbrasAlarmSensor(coordinator),
-        ]
-    )
-
-    async_add_entities(entities)
+    async_add_entities(IntelbrasBinarySensor(coordinator, description) for description in BINARY_SENSORS)
 
 
-class IntelbrasConnectionSensor(CoordinatorEntity, BinarySensorEntity):
-    """Representation of an Intelbras connection sensor."""
+class IntelbrasBinarySensor(CoordinatorEntity, BinarySensorEntity):
+    """Representation of an Intelbras status binary sensor."""
 
-    _attr_name = "Connection"
-    _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
+    entity_description: IntelbrasBinarySensorEntityDescription
 
-    def __init__(self, coordinator: IntelbrasAlarmCoordinator) -> None:
-        """Initialize the connection sensor."""
+    def __init__(
+        self,
+        coordinator: IntelbrasAlarmCoordinator,
+        description: IntelbrasBinarySensorEntityDescription,
+    ) -> None:
+        """Initialize the binary sensor."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.entry.entry_id}_connection"
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.entry.entry_id}_{description.key}"
         self._attr_device_info = coordinator.device_info
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if connected."""
-        if not self.coordinator.data or "status" not in self.coordinator.data:
-            return False
-        return self.coordinator.data["status"].get("connected", False)
-
-
-class IntelbrasAlarmSensor(CoordinatorEntity, BinarySensorEntity):
-    """Representation of an Intelbras alarm sensor."""
-
-    _attr_name = "Alarm"
-    _attr_device_class = BinarySensorDeviceClass.SAFETY
-
-    def __init__(self, coordinator: IntelbrasAlarmCoordinator) -> None:
-        """Initialize the alarm sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.entry.entry_id}_alarm"
-        self._attr_device_info = coordinator.device_info
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if alarm is triggered."""
-        if not self.coordinator.data or "status" not in self.coordinator.data:
-            return False
-        return self.coordinator.data["status"].get("alarm", False)
+        self._update_from_coordinator()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the cached state from the latest coordinator data."""
+        self._update_from_coordinator()
+        self.async_write_ha_state()
+
+    def _update_from_coordinator(self) -> None:
+        """Set the state from this sensor's status field."""
+        status = self.coordinator.get_status()
+        self._attr_is_on = status.get(self.entity_description.status_key, False) if status else False
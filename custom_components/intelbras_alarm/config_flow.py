@@ -24,6 +24,9 @@ from .protocol import IntelbrasConnector
 
 _LOGGER = logging.getLogger(__name__)
 
+_IP_RE = re.compile(r"^(\d{1,3}\.){3}\d{1,3}$")
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
 
 def validate_and_clean_password(password: str) -> str:
     """Validate and clean remote password format."""
@@ -31,7 +34,7 @@ def validate_and_clean_password(password: str) -> str:
     clean_password = password.strip().replace(" ", "").replace("-", "")
 
     # Must be 4-6 digits
-    if not re.match(r"^[0-9A-Fa-f]{4,6}$", clean_password):
+    if not 4 <= len(clean_password) <= 6 or not _HEX_DIGITS.issuperset(clean_password):
         raise vol.Invalid("Remote password must be 4-6 digits (e.g., 1234, 878787)")
 
     return clean_password.upper()
@@ -70,7 +73,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         try:
             # Validate IP address format
             ip_address = user_input[CONF_PANEL_IP].strip()
-            if not re.match(r"^(\d{1,3}\.){3}\d{1,3}$", ip_address):
+            if not _IP_RE.match(ip_address):
                 errors[CONF_PANEL_IP] = "panel_ip"
 
             # Validate and clean password
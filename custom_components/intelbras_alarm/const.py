@@ -19,6 +19,27 @@ DEFAULT_RETRIES: Final = 3
 DEFAULT_SCAN_INTERVAL: Final = 5  # seconds — fast enough that brief siren
                                   # windows aren't missed between polls
 
+# Adaptive polling - back off while the panel sits disarmed and unchanged or
+# is unreachable, snap back to the default interval on any change, while
+# armed and after commands
+MIN_SCAN_INTERVAL: Final = DEFAULT_SCAN_INTERVAL
+MAX_SCAN_INTERVAL: Final = 30  # seconds
+UNREACHABLE_MAX_SCAN_INTERVAL: Final = 120  # seconds, ceiling while the panel can't be reached
+POST_COMMAND_FAST_POLL_DURATION: Final = 30  # seconds at the fast rate after a command
+
+# Stale data - keep serving the last good status through short outages
+STALE_DATA_MAX_FAILURES: Final = 3  # consecutive failed polls
+STALE_DATA_MAX_AGE: Final = 120  # seconds since the last good poll
+
+# Command retries - exponential backoff with jitter between attempts
+COMMAND_MAX_RETRIES: Final = 2
+COMMAND_RETRY_BASE_DELAY: Final = 0.25  # seconds
+COMMAND_RETRY_MAX_DELAY: Final = 4.0  # seconds
+POST_COMMAND_REFRESH_DELAY: Final = 0.4  # seconds for the panel to apply a command
+PGM_STATE_TTL: Final = 5  # seconds a commanded PGM state is trusted to skip repeats
+DISCONNECT_TIMEOUT: Final = 3  # seconds allowed for a clean disconnect
+ARM_STATUS_MAX_AGE: Final = 2.0  # seconds a polled status is trusted before arm/disarm
+
 # Connection types
 CONNECTION_TYPE_LOCAL: Final = "local"
 
@@ -37,7 +58,7 @@ NATIVE_PROTOCOL_ID: Final = 0xE7  # Protocol identifier (231 decimal)
 NATIVE_AUTH_REQUEST: Final = 0x09  # Authentication request prefix (09e7051182745a34edef9f)
 NATIVE_AUTH_SUBTYPE: Final = 0x05  # Authentication subtype
 NATIVE_AUTH_CMD: Final = 0x11  # Authentication command
-NATIVE_AUTH_CONSTANTS: Final = [0x34, 0xED, 0xEF, 0x9F]  # Constants appended to encoded password
+NATIVE_AUTH_CONSTANTS: Final = bytes((0x34, 0xED, 0xEF, 0x9F))  # Constants appended to encoded password
 
 # === STATUS COMMANDS ===
 NATIVE_STATUS_REQUEST: Final = 0x05  # Status request prefix
@@ -54,7 +75,7 @@ NATIVE_CMD_AUTH_STATUS: Final = 0x17  # Authenticated status command (05e7011786
 NATIVE_CMD_ARM_DISARM: Final = 0x06  # Command prefix for arm/disarm toggle
 NATIVE_ARM_DISARM_SUBTYPE: Final = 0x02  # Subtype for arm/disarm
 NATIVE_ARM_DISARM_CMD: Final = 0x16  # Command byte
-NATIVE_ARM_DISARM_DATA: Final = [0x00, 0x74, 0x28, 0x56]  # Fixed data for toggle
+NATIVE_ARM_DISARM_DATA: Final = bytes((0x00, 0x74, 0x28, 0x56))  # Fixed data for toggle
 
 # PGM Control Commands - toggle commands (ON->OFF, OFF->ON)
 NATIVE_CMD_PGM: Final = 0x06  # Command prefix for PGM
@@ -63,16 +84,16 @@ NATIVE_PGM_CMD: Final = 0x19  # Command byte for PGM
 
 # PGM command data - byte 4 determines PGM number, increments by 0x20
 # From confirmed packet captures - PGM 1 and 2 tested, 3 and 4 predicted
-NATIVE_PGM1_DATA: Final = [0x60, 0x57, 0x68, 0x5A]  # PGM 1 toggle (confirmed working)
-NATIVE_PGM2_DATA: Final = [0x80, 0xD5, 0x2B, 0x7B]  # PGM 2 toggle (confirmed working)
-NATIVE_PGM3_DATA: Final = [0xA0, 0x53, 0x0B, 0x38]  # PGM 3 toggle (predicted pattern)
-NATIVE_PGM4_DATA: Final = [0xC0, 0xD1, 0x6B, 0x19]  # PGM 4 toggle (predicted pattern)
+NATIVE_PGM1_DATA: Final = bytes((0x60, 0x57, 0x68, 0x5A))  # PGM 1 toggle (confirmed working)
+NATIVE_PGM2_DATA: Final = bytes((0x80, 0xD5, 0x2B, 0x7B))  # PGM 2 toggle (confirmed working)
+NATIVE_PGM3_DATA: Final = bytes((0xA0, 0x53, 0x0B, 0x38))  # PGM 3 toggle (predicted pattern)
+NATIVE_PGM4_DATA: Final = bytes((0xC0, 0xD1, 0x6B, 0x19))  # PGM 4 toggle (predicted pattern)
 
 # === SESSION MANAGEMENT ===
 NATIVE_LOGOUT_REQUEST: Final = 0x05  # Logout request prefix
 NATIVE_LOGOUT_SUBTYPE: Final = 0x01  # Logout subtype
 NATIVE_LOGOUT_CMD: Final = 0x15  # Logout command (05e70115067e71)
-NATIVE_LOGOUT_DATA: Final = [0x06, 0x7E, 0x71]  # Logout data
+NATIVE_LOGOUT_DATA: Final = bytes((0x06, 0x7E, 0x71))  # Logout data
 
 # === RESPONSE ANALYSIS ===
 # Armed state detection in authenticated status response (32 bytes)
@@ -82,8 +103,8 @@ NATIVE_STATUS_ARMED: Final = 0x03  # Value when armed
 
 # PGM state detection in toggle response
 NATIVE_PGM_STATE_BYTE: Final = 5  # Byte index for PGM state in response
-NATIVE_PGM_ON_VALUES: Final = [0x40, 0x57, 0x60, 0xD6]  # Added 0xd6 based on actual panel response
-NATIVE_PGM_OFF_VALUES: Final = [0x20, 0x00]  # Values indicating PGM is OFF
+NATIVE_PGM_ON_VALUES: Final = frozenset({0x40, 0x57, 0x60, 0xD6})  # Added 0xd6 based on actual panel response
+NATIVE_PGM_OFF_VALUES: Final = frozenset({0x20, 0x00})  # Values indicating PGM is OFF
 
 # === PACKET STRUCTURE REFERENCE ===
 # Format: [PREFIX][0xe7][SUBTYPE][CMD][DATA...][CHECKSUM]
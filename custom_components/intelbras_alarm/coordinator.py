@@ -3,31 +3,64 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import datetime, timedelta
+from itertools import islice
 import logging
-import socket
+import random
 import time
-import binascii
-from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
 from .const import (
+    COMMAND_MAX_RETRIES,
+    COMMAND_RETRY_BASE_DELAY,
+    COMMAND_RETRY_MAX_DELAY,
     CONF_PANEL_IP,
     CONF_PASSWORD,
-    DEFAULT_NAME,
     DEFAULT_SCAN_INTERVAL,
+    DISCONNECT_TIMEOUT,
     DOMAIN,
     MANUFACTURER,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
     MODEL_PREFIX,
+    PGM_STATE_TTL,
+    POST_COMMAND_FAST_POLL_DURATION,
+    POST_COMMAND_REFRESH_DELAY,
+    STALE_DATA_MAX_AGE,
+    STALE_DATA_MAX_FAILURES,
+    UNREACHABLE_MAX_SCAN_INTERVAL,
 )
+from .protocol import IntelbrasConnector, IntelbrasFatalError, IntelbrasTransientError
 
 _LOGGER = logging.getLogger(__name__)
 
+# Status reported while the connection control switch is off. Shared and
+# read-only since it never changes.
+_DISCONNECTED_STATUS: Mapping[str, Any] = MappingProxyType(
+    {
+        "connected": False,
+        "authenticated": False,
+        "armed": None,  # Unknown state
+        "partial_armed": None,  # Unknown state
+        "alarm": None,  # Unknown state
+        "pgms": (),  # No PGM data when disconnected
+        "events": (),
+        "connection_disabled": True,
+        "source_voltage": None,
+        "battery_voltage": None,
+        "siren_status": None,
+        "battery_missing": None,
+        "firmware_version": None,
+    }
+)
+
 
 class IntelbrasAlarmCoordinator(DataUpdateCoordinator):
     """Coordinator for Intelbras Alarm."""
@@ -36,7 +69,7 @@ class IntelbrasAlarmCoordinator(DataUpdateCoordinator):
         """Initialize the coordinator."""
         self.hass = hass
         self.entry = entry
-        self.connector = None  # This will be initialized in the future
+        self.connector: IntelbrasConnector | None = None  # Created on first use
 
         # Extract connection info for device registry
         self.panel_ip = entry.data.get(CONF_PANEL_IP, "Unknown")
@@ -45,200 +78,461 @@ class IntelbrasAlarmCoordinator(DataUpdateCoordinator):
         # Determine device model and identifiers
         self.device_model = self._determine_device_model()
         self.device_identifiers = self._get_device_identifiers()
+        # Shared by entities to build unique IDs. Picked by domain so it stays
+        # stable if more identifiers are ever added to the set
+        self.device_id: str = next(identifier for domain, identifier in self.device_identifiers if domain == DOMAIN)
+        self._device_info: dict[str, Any] = {
+            "identifiers": self.device_identifiers,
+            "name": f"Intelbras {self.device_model}",
+            "manufacturer": MANUFACTURER,
+            "model": self.device_model,
+            "sw_version": "Unknown",
+        }
+
+        self._panel_info: dict[str, Any] = {
+            "ip": self.panel_ip,
+            "model": self.device_model,
+            "manufacturer": MANUFACTURER,
+        }
 
         # Timestamp tracking
-        self._last_successful_update: datetime | None = None
+        # Unix time of the last successful poll; converted to a datetime only
+        # when read
+        self._last_successful_update: float | None = None
 
         # Connection control - enabled by default
         self._connection_enabled = True
+        # Bumped whenever the connection is disabled. Polls and commands
+        # capture it when they start and drop their result if it changed, so
+        # nothing fetched before a disable is published after it
+        self._state_version = 0
+
+        # Monotonic time of the last successful command per PGM
+        self._pgm_command_times: dict[int, float] = {}
+        # PGM status entries by ID, rebuilt only when the polled status changes
+        self._pgm_cache: dict[int, dict[str, Any]] = {}
+        # PGM set requests currently being sent, by (PGM ID, state)
+        self._pgm_inflight: dict[tuple[int, bool], asyncio.Future[bool]] = {}
+
+        # Serializes panel operations. The connector locks each frame
+        # exchange, but arm/disarm read the status and then send a toggle, so
+        # the whole operation must not interleave with other commands
+        self._command_lock = asyncio.Lock()
+
+        # Last good poll, served while the panel briefly fails to respond
+        self._consecutive_failures = 0
+        self._last_good_data: dict[str, Any] | None = None
+        self._last_good_monotonic = 0.0
+
+        # Callbacks run on every successful poll, even when the status is
+        # unchanged and regular listeners are skipped
+        self._poll_listeners: list[CALLBACK_TYPE] = []
+
+        # Single trailing refresh shared by back-to-back commands
+        self._pending_refresh: asyncio.Task | None = None
+
+        # Adaptive polling - number of consecutive idle polls and the state
+        # seen on the previous poll
+        self._idle_ticks = 0
+        self._last_state_key: tuple[Any, ...] | None = None
+        # Consecutive polls that could not reach the panel
+        self._unreachable_polls = 0
+        # Monotonic deadline for the fast rate after a command
+        self._fast_poll_until = 0.0
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            # Unchanged polls hand back the previous result object, so
+            # listeners are only woken when the panel state actually changes.
+            # Entities that track poll times use async_add_poll_listener
+            always_update=False,
         )
 
+    def _ensure_connector(self) -> IntelbrasConnector:
+        """Return the panel connector, creating it if needed."""
+        if not self.connector:
+            self.connector = IntelbrasConnector(self.entry.data)
+        return self.connector
+
     def _determine_device_model(self) -> str:
         """Determine the device model based on available information."""
         # For now, default to AMT series since that's what we support
         return f"{MODEL_PREFIX} Panel"
 
-    def _get_device_identifiers(self) -> set[tuple[str, str]]:
+    def _get_device_identifiers(self) -> frozenset[tuple[str, str]]:
         """Get device identifiers for device registry."""
-        # Use IP address as identifier for local connections
-        return {(DOMAIN, self.panel_ip)}
+        # Use IP address as identifier for local connections; computed once
+        # and never mutated, so freeze it
+        return frozenset({(DOMAIN, self.panel_ip)})
+
+    def entity_unique_id(self, suffix: str) -> str:
+        """Return the unique ID for this panel's entity with the given suffix."""
+        return f"{self.device_id}_{suffix}"
 
     @property
     def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        # Try to get firmware version from latest status
-        firmware_version = "Unknown"
-        if self.data and "status" in self.data:
-            status = self.data["status"]
-            if status.get("firmware_version"):
-                firmware_version = status["firmware_version"]
+        """Return device information.
 
-        return {
-            "identifiers": self.device_identifiers,
-            "name": f"Intelbras {self.device_model}",
-            "manufacturer": MANUFACTURER,
-            "model": self.device_model,
-            "sw_version": firmware_version,
-        }
+        The same dict is shared by every entity of this panel; only the
+        firmware version is updated, when a poll reports a new one.
+        """
+        return self._device_info
 
     @property
     def panel_info(self) -> dict[str, Any]:
         """Return panel information."""
+        return self._panel_info
+
+    @property
+    def connection_enabled(self) -> bool:
+        """Return True if the connection control switch allows connecting."""
+        return self._connection_enabled
+
+    async def async_enable_connection(self) -> None:
+        """Allow connecting to the panel again and refresh its status."""
+        self._connection_enabled = True
+        await self.async_request_refresh()
+
+    async def async_disable_connection(self) -> None:
+        """Disconnect from the panel and publish the disconnected status.
+
+        Published directly rather than through a refresh, since nothing has
+        to be fetched from the panel - only the connection closed.
+        """
+        self._connection_enabled = False
+        self.async_set_updated_data(await self._async_disconnected_data())
+
+    async def _async_disconnected_data(self) -> dict[str, Any]:
+        """Drop the panel connection and return the disconnected status."""
+        _LOGGER.debug("Connection disabled via switch - disconnecting and clearing data")
+        # Bumped before waiting on the disconnect so a poll or command that
+        # finishes meanwhile discards its result
+        self._state_version += 1
+
+        # Disconnect and cleanup connector when disabled. Shielded so a
+        # cancelled refresh (e.g. during shutdown) still closes the socket
+        # cleanly instead of leaving it half-open on the panel side.
+        if self.connector:
+            try:
+                async with asyncio.timeout(DISCONNECT_TIMEOUT):
+                    await asyncio.shield(self._async_locked_disconnect(self.connector))
+            except Exception as ex:
+                _LOGGER.debug("Error during disconnect: %s", ex)
+            finally:
+                self.connector = None
+
+        # Clear last successful update timestamp so entities show as unavailable
+        self._last_successful_update = None
+        self._last_good_data = None
+        self._pgm_cache = {}
+
+        # Return disconnected status with no cached data
         return {
-            "ip": self.panel_ip,
-            "model": self.device_model,
-            "manufacturer": MANUFACTURER,
+            "status": _DISCONNECTED_STATUS,
+            "panel_info": self.panel_info,
+            "last_update": time.time(),
         }
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data via library."""
         # Check if connection is enabled via the connection control switch
         if not self._connection_enabled:
-            _LOGGER.debug("Connection disabled via switch - disconnecting and clearing data")
-
-            # Disconnect and cleanup connector when disabled
-            if self.connector:
-                try:
-                    await self.connector.async_disconnect()
-                except Exception as ex:
-                    _LOGGER.debug("Error during disconnect: %s", ex)
-                finally:
-                    self.connector = None
-
-            # Clear last successful update timestamp so entities show as unavailable
-            self._last_successful_update = None
-
-            # Return disconnected status with no cached data
-            return {
-                "status": {
-                    "connected": False,
-                    "authenticated": False,
-                    "armed": None,  # Unknown state
-                    "partial_armed": None,  # Unknown state
-                    "alarm": None,  # Unknown state
-                    "pgms": [],  # No PGM data when disconnected
-                    "events": [],
-                    "connection_disabled": True,
-                    "source_voltage": None,
-                    "battery_voltage": None,
-                    "siren_status": None,
-                    "battery_missing": None,
-                    "firmware_version": None,
-                },
-                "panel_info": self.panel_info,
-                "last_update": time.time(),
-            }
+            return await self._async_disconnected_data()
 
+        version = self._state_version
         try:
-            if not self.connector:
-                from .protocol import IntelbrasConnector
+            # Get current status
+            async with self._command_lock:
+                status = await self._ensure_connector().async_get_status()
 
-                self.connector = IntelbrasConnector(self.entry.data)
+            if self._state_version != version:
+                return self._discard_poll()
 
-            # Get current status
-            status = await self.connector.async_get_status()
+            if not status.get("connected"):
+                # The connector reports outages as a disconnected status rather
+                # than raising, so count them as failed polls too
+                reason = status.get("connection_error", "Panel not connected")
+                if (stale := self._stale_data(reason)) is not None:
+                    return stale
 
-            # Update timestamp on successful data retrieval
-            self._last_successful_update = dt_util.now()
+                return {
+                    "status": status,
+                    "panel_info": self.panel_info,
+                    "last_update": time.time(),
+                }
 
-            return {
-                "status": status,
-                "panel_info": self.panel_info,
-                "last_update": time.time(),
-            }
+            # Update timestamp on successful data retrieval
+            now = time.time()
+            self._last_successful_update = now
+
+            # Track firmware changes on the shared device info
+            firmware_version = status.get("firmware_version")
+            if firmware_version and firmware_version != self._device_info["sw_version"]:
+                self._device_info["sw_version"] = firmware_version
+
+            self._adjust_update_interval(status)
+
+            if self._last_good_data is not None and status is self._last_good_data["status"]:
+                # Unchanged status - reuse the previous result
+                data = self._last_good_data
+                data["last_update"] = now
+                if self.last_update_success:
+                    # Otherwise the recovery wakes every listener anyway
+                    self._async_notify_poll_listeners()
+            else:
+                data = {
+                    "status": status,
+                    "panel_info": self.panel_info,
+                    "last_update": now,
+                }
+                self._pgm_cache = {pgm["id"]: pgm for pgm in status.get("pgms", ())}
+            self._consecutive_failures = 0
+            self._last_good_data = data
+            self._last_good_monotonic = time.monotonic()
+            return data
 
         except Exception as err:
-            _LOGGER.error("Error communicating with alarm panel: %s", err)
-            raise UpdateFailed(f"Error communicating with alarm panel: {err}")
+            if self._state_version != version:
+                return self._discard_poll()
 
-    # Control methods
-    async def async_arm(self, mode: str = "away") -> bool:
-        """Arm the alarm system with retry logic for connection resilience."""
-        max_retries = 2
-
-        for attempt in range(max_retries + 1):
-            try:
-                if not self.connector:
-                    from .protocol import IntelbrasConnector
+            if (stale := self._stale_data(err)) is not None:
+                return stale
 
-                    self.connector = IntelbrasConnector(self.entry.data)
+            _LOGGER.error("Error communicating with alarm panel: %s", err)
+            raise UpdateFailed(f"Error communicating with alarm panel: {err}")
 
-                _LOGGER.info("Sending ARM command (attempt %d/%d)", attempt + 1, max_retries + 1)
-                success = await self.connector.async_arm()
+    def _discard_poll(self) -> dict[str, Any] | None:
+        """Drop a poll that finished after the connection was disabled.
+
+        Disabling publishes the disconnected status itself, so keep the
+        current data.
+        """
+        _LOGGER.debug("Connection disabled during poll, discarding its result")
+        return self.data
+
+    def _stale_data(self, err: object) -> dict[str, Any] | None:
+        """Count a failed poll and return the last good data if it may still be served.
+
+        Rides out short glitches with the last good data instead of marking
+        every entity unavailable. Returns None once the glitch has lasted too
+        long or too many polls in a row.
+        """
+        self._consecutive_failures += 1
+        self._adjust_update_interval(None)
+
+        if (
+            self._last_good_data is None
+            or self._consecutive_failures > STALE_DATA_MAX_FAILURES
+            or time.monotonic() - self._last_good_monotonic >= STALE_DATA_MAX_AGE
+        ):
+            return None
 
-                if success:
-                    # Refresh data to get updated status
-                    await asyncio.sleep(0.5)  # Brief delay for panel to process
-                    await self.async_request_refresh()
+        _LOGGER.debug(
+            "Error communicating with alarm panel (failure %d), serving last known status: %s",
+            self._consecutive_failures,
+            err,
+        )
+        return {
+            **self._last_good_data,
+            "status": {**self._last_good_data["status"], "stale": True},
+            "last_update": time.time(),
+        }
 
-                _LOGGER.info("ARM command result: %s", "SUCCESS" if success else "FAILED")
-                return success
+    @callback
+    def async_add_poll_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for every successful poll, including unchanged ones.
+
+        Regular listeners already run whenever the data changes; this covers
+        the polls they skip. Returns a function that removes the listener.
+        """
+        self._poll_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._poll_listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_notify_poll_listeners(self) -> None:
+        """Run the poll listeners for a poll that left the data unchanged."""
+        for update_callback in list(self._poll_listeners):
+            update_callback()
+
+    def _adjust_update_interval(self, status: dict[str, Any] | None) -> None:
+        """Pick the next poll interval from panel reachability and activity.
+
+        Unreachable panels (no status or not connected) are backed off up to
+        UNREACHABLE_MAX_SCAN_INTERVAL. Reachable panels back off while idle
+        and snap back on any change. Recent commands force the fast rate.
+        """
+        if status is None or not status.get("connected"):
+            self._unreachable_polls += 1
+            self._idle_ticks = 0
+            self._last_state_key = None
+            seconds = min(UNREACHABLE_MAX_SCAN_INTERVAL, MIN_SCAN_INTERVAL * 2 ** min(self._unreachable_polls, 5))
+        else:
+            self._unreachable_polls = 0
+            state_key = (
+                status.get("armed"),
+                status.get("partial_armed"),
+                status.get("alarm"),
+                status.get("siren_status"),
+                len(status.get("events", [])),
+            )
+
+            # Armed panels are always polled at the fast rate so a trigger is
+            # never missed
+            if state_key != self._last_state_key or status.get("armed") or status.get("alarm"):
+                self._idle_ticks = 0
+            else:
+                self._idle_ticks += 1
+            self._last_state_key = state_key
+
+            seconds = min(MAX_SCAN_INTERVAL, MIN_SCAN_INTERVAL * 2 ** min(self._idle_ticks, 3))
+
+        if time.monotonic() < self._fast_poll_until:
+            seconds = MIN_SCAN_INTERVAL
+
+        self._set_update_interval(seconds)
+
+    def _set_update_interval(self, seconds: float) -> None:
+        """Apply a new poll interval if it changed."""
+        if self.update_interval != timedelta(seconds=seconds):
+            _LOGGER.debug("Adjusting update interval to %ss", seconds)
+            self.update_interval = timedelta(seconds=seconds)
+
+    def _boost_polling(self) -> None:
+        """Poll at the fast rate for a while after a user command."""
+        self._fast_poll_until = time.monotonic() + POST_COMMAND_FAST_POLL_DURATION
+        self._idle_ticks = 0
+        self._set_update_interval(MIN_SCAN_INTERVAL)
 
-            except Exception as err:
-                _LOGGER.warning("Error arming panel (attempt %d/%d): %s", attempt + 1, max_retries + 1, err)
-                if attempt < max_retries:
-                    _LOGGER.info("Retrying arm command in 1 second...")
-                    await asyncio.sleep(1)
-                else:
-                    _LOGGER.error("All arm attempts failed")
-                    return False
+    # Control methods
+    async def _async_run_command(
+        self,
+        name: str,
+        command: Callable[[], Awaitable[bool]],
+        retry_on_failure: bool = False,
+    ) -> bool:
+        """Run a panel command, retrying connection errors with exponential backoff.
+
+        Delays grow from COMMAND_RETRY_BASE_DELAY up to COMMAND_RETRY_MAX_DELAY
+        and are jittered so concurrent commands don't retry in lockstep.
+        Only transient errors are retried; fatal and unexpected errors are
+        logged and give up at once. Returns True if the panel accepted the
+        command, so callers only ever see a bool.
+        """
+        attempts = COMMAND_MAX_RETRIES + 1
+
+        for attempt in range(1, attempts + 1):
+            try:
+                self._ensure_connector()
 
-        return False
+                _LOGGER.debug("Sending %s command (attempt %d/%d)", name, attempt, attempts)
+                async with self._command_lock:
+                    success = await command()
 
-    async def async_disarm(self) -> bool:
-        """Disarm the alarm system with retry logic for connection resilience."""
-        max_retries = 2
+                if success or not retry_on_failure:
+                    _LOGGER.info("%s command result: %s", name, "SUCCESS" if success else "FAILED")
+                    if success:
+                        self._boost_polling()
+                    return success
 
-        for attempt in range(max_retries + 1):
-            try:
-                if not self.connector:
-                    from .protocol import IntelbrasConnector
+                _LOGGER.warning("%s command result: FAILED (attempt %d/%d)", name, attempt, attempts)
 
-                    self.connector = IntelbrasConnector(self.entry.data)
+            except (IntelbrasTransientError, asyncio.TimeoutError, OSError) as err:
+                _LOGGER.warning("Error sending %s command (attempt %d/%d): %s", name, attempt, attempts, err)
+            except IntelbrasFatalError as err:
+                _LOGGER.error("%s command failed: %s", name, err)
+                return False
+            except Exception as err:
+                _LOGGER.error("Unexpected error sending %s command: %s", name, err)
+                return False
 
-                _LOGGER.info("Sending DISARM command (attempt %d/%d)", attempt + 1, max_retries + 1)
-                success = await self.connector.async_disarm()
+            if attempt < attempts:
+                delay = min(COMMAND_RETRY_MAX_DELAY, COMMAND_RETRY_BASE_DELAY * 2 ** (attempt - 1))
+                delay *= 0.5 + random.random() * 0.5
+                _LOGGER.debug("Retrying %s command in %.2f seconds...", name, delay)
+                await asyncio.sleep(delay)
 
-                if success:
-                    # Refresh data to get updated status
-                    await asyncio.sleep(0.5)  # Brief delay for panel to process
-                    await self.async_request_refresh()
+        _LOGGER.error("All %s attempts failed", name)
+        return False
 
-                _LOGGER.info("DISARM command result: %s", "SUCCESS" if success else "FAILED")
-                return success
+    async def async_arm(self, mode: str = "away") -> bool:
+        """Arm the alarm system with retry logic for connection resilience.
+
+        Returns True if the panel accepted the command. Errors are logged,
+        never raised.
+        """
+        version = self._state_version
+        success = await self._async_run_command("ARM", lambda: self.connector.async_arm())
+        if success and self._state_version == version:
+            # Show the new state right away; the next poll reconciles it
+            self._apply_optimistic_armed_state(True)
+        return success
 
-            except Exception as err:
-                _LOGGER.warning("Error disarming panel (attempt %d/%d): %s", attempt + 1, max_retries + 1, err)
-                if attempt < max_retries:
-                    _LOGGER.info("Retrying disarm command in 1 second...")
-                    await asyncio.sleep(1)
-                else:
-                    _LOGGER.error("All disarm attempts failed")
-                    return False
+    async def async_disarm(self) -> bool:
+        """Disarm the alarm system with retry logic for connection resilience.
+
+        Returns True if the panel accepted the command. Errors are logged,
+        never raised.
+        """
+        version = self._state_version
+        success = await self._async_run_command("DISARM", lambda: self.connector.async_disarm())
+        if success and self._state_version == version:
+            # Show the new state right away; the next poll reconciles it
+            self._apply_optimistic_armed_state(False)
+        return success
+
+    @callback
+    def _apply_optimistic_armed_state(self, armed: bool) -> None:
+        """Publish the expected armed state after a confirmed arm/disarm command."""
+        if not self.data or "status" not in self.data:
+            return
+
+        # Arm always performs a full arm on the panel, so partial_armed is cleared.
+        # Only published to entities: the connector's last status stays the
+        # polled one, since arm/disarm base their toggle direction on it
+        status = {**self.data["status"], "armed": armed, "partial_armed": False}
+        self.async_set_updated_data({**self.data, "status": status})
+
+    @callback
+    def _schedule_post_command_refresh(self, delay: float = POST_COMMAND_REFRESH_DELAY) -> None:
+        """Schedule one status refresh after a command, replacing any pending one.
+
+        Commands sent in quick succession (e.g. several PGMs toggled from a
+        dashboard) end up sharing a single trailing refresh.
+        """
+        if self._pending_refresh and not self._pending_refresh.done():
+            self._pending_refresh.cancel()
+
+        self._pending_refresh = self.entry.async_create_background_task(
+            self.hass, self._async_delayed_refresh(delay), f"{DOMAIN} post-command refresh"
+        )
 
-        return False
+    async def _async_delayed_refresh(self, delay: float) -> None:
+        """Wait for the panel to process a command, then refresh status."""
+        await asyncio.sleep(delay)  # Brief delay for panel to process
+        self._pending_refresh = None
+        await self.async_request_refresh()
 
     async def async_trigger_pgm(self, pgm_id: int) -> bool:
         """Trigger PGM output (same as set_pgm with toggle behavior)."""
         try:
-            if not self.connector:
-                from .protocol import IntelbrasConnector
-
-                self.connector = IntelbrasConnector(self.entry.data)
-
-            _LOGGER.info("Triggering PGM %s", pgm_id)
-            success = await self.connector.async_set_pgm(pgm_id, True)  # State doesn't matter for toggle
+            _LOGGER.debug("Triggering PGM %s", pgm_id)
+            version = self._state_version
+            async with self._command_lock:
+                success = await self._ensure_connector().async_set_pgm(pgm_id, True)  # State doesn't matter for toggle
 
             if success:
-                # Refresh data to get updated status
-                await asyncio.sleep(0.5)  # Brief delay for panel to process
-                await self.async_request_refresh()
+                self._track_pgm_toggle(pgm_id, version)
+                # Refresh data to update UI with new state
+                self._boost_polling()
+                self._schedule_post_command_refresh()
 
             _LOGGER.info("PGM %s trigger result: %s", pgm_id, "SUCCESS" if success else "FAILED")
             return success
@@ -248,59 +542,100 @@ class IntelbrasAlarmCoordinator(DataUpdateCoordinator):
             return False
 
     async def async_set_pgm(self, pgm_id: int, state: bool) -> bool:
-        """Set PGM output with retry logic for connection resilience."""
-        max_retries = 2
-
-        for attempt in range(max_retries + 1):
-            try:
-                if not self.connector:
-                    from .protocol import IntelbrasConnector
-
-                    self.connector = IntelbrasConnector(self.entry.data)
-
-                action = "enable" if state else "disable"
-                _LOGGER.info("Setting PGM %s to %s (attempt %d/%d)", pgm_id, action, attempt + 1, max_retries + 1)
-
-                # Send PGM command - protocol layer handles state tracking
-                success = await self.connector.async_set_pgm(pgm_id, state)
+        """Set PGM output with retry logic for connection resilience.
+
+        Identical requests made while one is already in flight share its
+        result instead of sending (and retrying) their own command.
+        """
+        key = (pgm_id, state)
+        if (inflight := self._pgm_inflight.get(key)) is not None:
+            _LOGGER.debug("PGM %s command already in flight, sharing its result", pgm_id)
+            return await asyncio.shield(inflight)
+
+        future: asyncio.Future[bool] = self.hass.loop.create_future()
+        self._pgm_inflight[key] = future
+        try:
+            success = await self._async_send_pgm(pgm_id, state)
+        except asyncio.CancelledError:
+            # Only the owning call was cancelled; waiters just see a failure
+            future.set_result(False)
+            raise
+        except Exception as err:
+            future.set_exception(err)
+            # Mark it retrieved so an unshared failure isn't logged as unhandled
+            future.exception()
+            raise
+        else:
+            future.set_result(success)
+            return success
+        finally:
+            del self._pgm_inflight[key]
+
+    async def _async_send_pgm(self, pgm_id: int, state: bool) -> bool:
+        """Send one PGM set request unless the PGM is already in that state."""
+        action = "enable" if state else "disable"
+
+        # PGM commands are toggles, so re-sending a state we just set would
+        # flip the output back. Trust the tracked state only briefly since
+        # pulse outputs turn themselves off after a few seconds.
+        current = self.get_pgm_status(pgm_id)
+        if (
+            current is not None
+            and current.get("active") == state
+            and time.monotonic() - self._pgm_command_times.get(pgm_id, float("-inf")) < PGM_STATE_TTL
+        ):
+            _LOGGER.debug("PGM %s already %sd, skipping command", pgm_id, action)
+            return True
+
+        # Send PGM command - protocol layer handles state tracking
+        version = self._state_version
+        success = await self._async_run_command(
+            f"PGM {pgm_id} {action}",
+            lambda: self.connector.async_set_pgm(pgm_id, state),
+            retry_on_failure=True,
+        )
 
-                if success:
-                    # Refresh data to update UI with new state
-                    await asyncio.sleep(0.3)  # Brief delay for panel to process
-                    await self.async_request_refresh()
+        if success:
+            self._pgm_command_times[pgm_id] = time.monotonic()
+            self._track_pgm_toggle(pgm_id, version)
+            # Refresh data to update UI with new state
+            self._schedule_post_command_refresh()
 
-                    _LOGGER.info("PGM %s %s result: SUCCESS", pgm_id, action)
-                    return True
-                else:
-                    _LOGGER.warning("PGM %s %s result: FAILED", pgm_id, action)
+        return success
 
-            except Exception as ex:
-                action = "enable" if state else "disable"
-                _LOGGER.warning(
-                    "Failed to %s PGM %s (attempt %d/%d): %s", action, pgm_id, attempt + 1, max_retries + 1, ex
-                )
-                if attempt < max_retries:
-                    _LOGGER.info("Retrying PGM %s command in 1 second...", pgm_id)
-                    await asyncio.sleep(1)
-                else:
-                    _LOGGER.error("All PGM %s attempts failed", pgm_id)
-                    return False
+    def _track_pgm_toggle(self, pgm_id: int, version: int) -> None:
+        """Update the cached PGM entry right after a command.
 
-        return False
+        The post-command refresh confirms it, but a repeated command arriving
+        before then must already see the toggled state. Skipped if the
+        connection was disabled since the command started (version changed).
+        """
+        if self._state_version != version or not self.connector:
+            return
+        if (pgm_status := self.connector.get_pgm_status(pgm_id)) is not None:
+            self._pgm_cache[pgm_id] = pgm_status
 
     def get_pgm_status(self, pgm_id: int) -> dict[str, Any] | None:
-        """Get status of a specific PGM."""
-        if not self.connector:
-            return None
+        """Get status of a specific PGM from the last polled status."""
+        return self._pgm_cache.get(pgm_id)
 
-        return self.connector.get_pgm_status(pgm_id)
+    def get_status(self) -> dict[str, Any] | None:
+        """Get the latest panel status, or None before the first update."""
+        data = self.data
+        return data.get("status") if data else None
 
     def get_alarm_status(self) -> dict[str, Any]:
         """Get alarm status in format expected by alarm_control_panel."""
-        if not self.connector:
+        if not self.connector or not self.data:
             return {"armed": False, "partial_armed": False, "alarm": False}
 
-        return self.connector.get_alarm_status()
+        # Read from the published data so optimistic updates show right away
+        status = self.data["status"]
+        return {
+            "armed": status.get("armed", False),
+            "partial_armed": status.get("partial_armed", False),
+            "alarm": status.get("alarm", False),
+        }
 
     def get_connection_info(self) -> dict[str, Any]:
         """Get connection information for debugging."""
@@ -326,39 +661,66 @@ class IntelbrasAlarmCoordinator(DataUpdateCoordinator):
     @property
     def last_successful_update_time(self) -> datetime | None:
         """Get the timestamp of the last successful update."""
-        return self._last_successful_update
-
-    # Legacy methods for backwards compatibility
-    async def async_arm_away(self) -> bool:
-        """Legacy method - arm in away mode."""
-        return await self.async_arm("away")
-
-    async def async_arm_home(self) -> bool:
-        """Legacy method - arm in home mode."""
-        return await self.async_arm("home")  # For now, same as away
-
-    async def async_arm_night(self) -> bool:
-        """Legacy method - arm in night mode."""
-        return await self.async_arm("night")  # For now, same as away
-
-    async def async_arm_vacation(self) -> bool:
-        """Legacy method - arm in vacation mode."""
-        return await self.async_arm("vacation")  # For now, same as away
+        if self._last_successful_update is None:
+            return None
+        return dt_util.utc_from_timestamp(self._last_successful_update)
 
-    async def async_arm_custom_bypass(self) -> bool:
-        """Legacy method - arm with custom bypass."""
-        return await self.async_arm("custom")  # For now, same as away
+    async def _async_locked_disconnect(self, connector: IntelbrasConnector) -> None:
+        """Disconnect the given connector once no command is in flight."""
+        async with self._command_lock:
+            await connector.async_disconnect()
 
     async def async_disconnect(self) -> None:
         """Disconnect from the panel."""
+        if self._pending_refresh:
+            self._pending_refresh.cancel()
+            self._pending_refresh = None
+
         if self.connector:
-            await self.connector.async_disconnect()
+            async with self._command_lock:
+                await self.connector.async_disconnect()
             self.connector = None
 
     def get_events(self, limit: int = 10) -> list[dict[str, Any]]:
-        """Get recent events."""
+        """Get recent events, shaped for use as state attributes."""
         if not self.data or "status" not in self.data:
             return []
 
-        events = self.data["status"].get("events", [])
-        return events[:limit]
+        return [
+            {
+                "description": event.get("description", "Unknown event"),
+                "timestamp": event.get("timestamp", "Unknown"),
+                "type": event.get("type", "unknown"),
+            }
+            for event in islice(self.data["status"].get("events", ()), limit)
+        ]
+
+
+# Legacy arm methods for backwards compatibility - method suffix -> arm mode.
+# The panel only supports a full arm, so every mode behaves like away.
+_LEGACY_ARM_MODES: dict[str, str] = {
+    "away": "away",
+    "home": "home",
+    "night": "night",
+    "vacation": "vacation",
+    "custom_bypass": "custom",
+}
+
+
+def _make_legacy_arm(mode: str) -> Callable[[IntelbrasAlarmCoordinator], Awaitable[bool]]:
+    """Build a legacy async_arm_<mode> method."""
+
+    async def _async_arm_mode(self: IntelbrasAlarmCoordinator) -> bool:
+        return await self.async_arm(mode)
+
+    return _async_arm_mode
+
+
+for _suffix, _mode in _LEGACY_ARM_MODES.items():
+    _method = _make_legacy_arm(_mode)
+    _method.__name__ = f"async_arm_{_suffix}"
+    _method.__qualname__ = f"{IntelbrasAlarmCoordinator.__name__}.{_method.__name__}"
+    _method.__doc__ = f"Legacy method - arm in {_mode} mode."
+    setattr(IntelbrasAlarmCoordinator, _method.__name__, _method)
+
+del _suffix, _mode, _method
@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+from functools import cache, reduce
 import logging
+from operator import xor
 import socket
+import struct
+import time
 from typing import Any
 
 try:
@@ -14,6 +18,7 @@ try:
         CONF_PORT,
         DEFAULT_PORT,
         DEFAULT_TIMEOUT,
+        ARM_STATUS_MAX_AGE,
         # Native protocol constants
         NATIVE_PROTOCOL_ID,
         NATIVE_AUTH_REQUEST,
@@ -53,6 +58,7 @@ except ImportError:
         CONF_PORT,
         DEFAULT_PORT,
         DEFAULT_TIMEOUT,
+        ARM_STATUS_MAX_AGE,
         # Native protocol constants
         NATIVE_PROTOCOL_ID,
         NATIVE_AUTH_REQUEST,
@@ -88,24 +94,72 @@ except ImportError:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Siren byte values observed on real panels
+_KNOWN_SIREN_OFF_VALUES: frozenset[int] = frozenset({0x11, 0x19, 0x01, 0x00, 0x07, 0x08, 0x10, 0x18})
+_KNOWN_SIREN_ON_VALUES: frozenset[int] = frozenset({0xFF, 0x80, 0x40, 0x20, 0xF0, 0xF8})
+
+
+def _classify_siren_byte(siren_byte: int) -> str:
+    """Classify the siren status byte (byte 28 of the status response)."""
+    if siren_byte in _KNOWN_SIREN_OFF_VALUES:
+        return "Off"
+    if siren_byte in _KNOWN_SIREN_ON_VALUES:
+        return "On"
+    if siren_byte & 0xF0 == 0x10:  # 0x1X pattern
+        return "Off"
+    if siren_byte > 0x80:  # High values typically On
+        return "On"
+    if siren_byte < 0x20:  # Low values typically Off
+        return "Off"
+    # Default to Off for unknown patterns
+    return "Off"
+
+
+# Siren status for every possible byte value, so parsing is a single lookup
+_SIREN_STATUS_TABLE: tuple[str, ...] = tuple(_classify_siren_byte(value) for value in range(256))
+
+# Bytes 19-29 of the authenticated status response: status byte 19, source
+# and battery voltage (big-endian u16 at 20 and 22), two unknown bytes,
+# firmware bytes 26-27, siren byte 28 and battery status byte 29
+_STATUS_FIELDS = struct.Struct(">BHH2xBBBB")
+
+# Firmware version by bytes 26-27 of the status response packed as a 16-bit
+# word. Byte 26 is major + 17 (up to 0x19) and byte 27 is minor + 1 (up to 0x0A).
+_FIRMWARE_VERSIONS: dict[int, str] = {
+    ((major + 17) << 8) | (minor + 1): f"{major}.{minor}.0" for major in range(9) for minor in range(10)
+}
+
+
+class IntelbrasError(Exception):
+    """Base error for Intelbras panel communication."""
+
+
+class IntelbrasTransientError(IntelbrasError):
+    """Error that may go away on retry (timeout, dropped connection)."""
+
+
+class IntelbrasFatalError(IntelbrasError, ValueError):
+    """Error that retrying cannot fix (invalid password format, unknown PGM)."""
+
 
 class IntelbrasNativeProtocol:
     """Native Intelbras protocol implementation using reverse-engineered 0xe7 protocol.
 
     Implements complete packet communication including authentication, status monitoring,
     and control commands based on AMT REMOTO MOBILE app analysis.
+
+    Builders for fixed commands are cached: their packets never change, so
+    each is assembled once and the same bytes object is returned afterwards.
     """
 
     @staticmethod
-    def calculate_checksum(data: list[int]) -> int:
+    def calculate_checksum(data: bytes) -> int:
         """Calculate packet checksum using discovered algorithm."""
-        checksum = 0
-        for byte_val in data:
-            checksum ^= byte_val
-        return checksum ^ 0xFF  # XOR with 0xFF to match packet capture
+        # XOR of all bytes, folded in C rather than a Python-level loop
+        return reduce(xor, data, 0) ^ 0xFF  # XOR with 0xFF to match packet capture
 
     @staticmethod
-    def encode_password(password_hex: str) -> list[int]:
+    def encode_password(password_hex: str) -> bytes:
         """Encode password using discovered algorithm.
 
         Algorithm: Convert hex password to bytes, add 10 to third byte, append constants.
@@ -118,27 +172,28 @@ class IntelbrasNativeProtocol:
             Encoded password bytes for authentication
         """
         try:
-            # Convert hex string to bytes
-            password_bytes = []
-            for i in range(0, len(password_hex), 2):
-                password_bytes.append(int(password_hex[i : i + 2], 16))
+            # Convert hex string to bytes; an odd trailing digit is its own byte
+            even_length = len(password_hex) & ~1
+            encoded = bytearray.fromhex(password_hex[:even_length])
+            if even_length != len(password_hex):
+                encoded.append(int(password_hex[even_length], 16))
 
             # Apply encoding: add 10 to third byte, append constants
-            encoded = password_bytes.copy()
             if len(encoded) >= 3:
-                encoded[2] += 10
+                encoded[2] = (encoded[2] + 10) & 0xFF
             encoded.extend(NATIVE_AUTH_CONSTANTS)
 
-            return encoded
+            return bytes(encoded)
 
         except ValueError as ex:
             _LOGGER.error("Invalid password format '%s': %s", password_hex, ex)
-            raise ValueError(f"Password must be hex string, got: {password_hex}")
+            raise IntelbrasFatalError(f"Password must be hex string, got: {password_hex}") from ex
 
     @staticmethod
+    @cache
     def build_initial_status() -> bytes:
         """Build initial status request (unauthenticated)."""
-        data = [NATIVE_PROTOCOL_ID, NATIVE_SUBTYPE_STATUS, NATIVE_CMD_SIMPLE_STATUS, 0x06, 0x60]
+        data = bytes((NATIVE_PROTOCOL_ID, NATIVE_SUBTYPE_STATUS, NATIVE_CMD_SIMPLE_STATUS, 0x06, 0x60))
         return IntelbrasNativeProtocol._build_packet(data)
 
     @staticmethod
@@ -146,33 +201,26 @@ class IntelbrasNativeProtocol:
         """Build authentication request using discovered algorithm."""
         encoded_password = IntelbrasNativeProtocol.encode_password(password_hex)
 
-        data = [
-            NATIVE_PROTOCOL_ID,
-            NATIVE_AUTH_SUBTYPE,
-            NATIVE_AUTH_CMD,
-        ]
-        data.extend(encoded_password)
+        data = bytes((NATIVE_PROTOCOL_ID, NATIVE_AUTH_SUBTYPE, NATIVE_AUTH_CMD)) + encoded_password
 
         return IntelbrasNativeProtocol._build_packet(data)
 
     @staticmethod
+    @cache
     def build_authenticated_status() -> bytes:
         """Build authenticated status request (returns 32 bytes with armed state)."""
-        data = [NATIVE_PROTOCOL_ID, NATIVE_SUBTYPE_STATUS, NATIVE_CMD_AUTH_STATUS, 0x86, 0x71]
+        data = bytes((NATIVE_PROTOCOL_ID, NATIVE_SUBTYPE_STATUS, NATIVE_CMD_AUTH_STATUS, 0x86, 0x71))
         return IntelbrasNativeProtocol._build_packet(data)
 
     @staticmethod
+    @cache
     def build_arm_disarm_toggle() -> bytes:
         """Build arm/disarm toggle command."""
-        data = [
-            NATIVE_PROTOCOL_ID,
-            NATIVE_ARM_DISARM_SUBTYPE,
-            NATIVE_ARM_DISARM_CMD,
-        ]
-        data.extend(NATIVE_ARM_DISARM_DATA)
+        data = bytes((NATIVE_PROTOCOL_ID, NATIVE_ARM_DISARM_SUBTYPE, NATIVE_ARM_DISARM_CMD)) + NATIVE_ARM_DISARM_DATA
         return IntelbrasNativeProtocol._build_packet(data)
 
     @staticmethod
+    @cache
     def build_pgm_toggle(pgm_id: int) -> bytes:
         """Build PGM toggle command packet."""
         pgm_data_map = {
@@ -183,25 +231,17 @@ class IntelbrasNativeProtocol:
         }
 
         if pgm_id not in pgm_data_map:
-            raise ValueError(f"Invalid PGM ID: {pgm_id}")
+            raise IntelbrasFatalError(f"Invalid PGM ID: {pgm_id}")
 
-        data = [
-            NATIVE_PROTOCOL_ID,
-            NATIVE_PGM_SUBTYPE,
-            NATIVE_PGM_CMD,
-        ] + pgm_data_map[pgm_id]
+        data = bytes((NATIVE_PROTOCOL_ID, NATIVE_PGM_SUBTYPE, NATIVE_PGM_CMD)) + pgm_data_map[pgm_id]
 
         return IntelbrasNativeProtocol._build_packet(data)
 
     @staticmethod
+    @cache
     def build_logout() -> bytes:
         """Build logout command to close session."""
-        data = [
-            NATIVE_PROTOCOL_ID,
-            NATIVE_LOGOUT_SUBTYPE,
-            NATIVE_LOGOUT_CMD,
-        ]
-        data.extend(NATIVE_LOGOUT_DATA)
+        data = bytes((NATIVE_PROTOCOL_ID, NATIVE_LOGOUT_SUBTYPE, NATIVE_LOGOUT_CMD)) + NATIVE_LOGOUT_DATA
         return IntelbrasNativeProtocol._build_packet(data)
 
     @staticmethod
@@ -227,153 +267,107 @@ class IntelbrasNativeProtocol:
             "battery_missing": None,
         }
 
-        if len(data) >= 7:
-            # Check if this is an authenticated status response (32+ bytes)
-            if len(data) >= 32:
-                # Extract armed state from byte 6 (0-based indexing)
-                armed_byte = data[NATIVE_STATUS_ARMED_BYTE]
-                result["armed"] = armed_byte == NATIVE_STATUS_ARMED
-                result["armed_byte_value"] = armed_byte
-                result["authenticated"] = True
-                # Byte 8 = alarm-memory latch (0x00 normally, 0x02 once an
-                # alarm has occurred). It survives disarm and re-arm, so it's
-                # NOT a live-siren signal — only useful for "an alarm happened
-                # recently" indicator.
-                # Byte 19 bit 1 (0x02) IS the live siren-active flag: it goes
-                # high while the siren is actually sounding and clears within
-                # a few seconds of disarm.
-                # Bit map of byte 19 observed on AMT 1016 NET (2026-04-27):
-                #   0x01 — always 1 (status frame marker?)
-                #   0x02 — siren currently active
-                #   0x08 — currently armed
-                #   0x10 — always 1 (status frame marker?)
-                #   other bits — unknown
-                alarm_memory_byte = data[8] if len(data) > 8 else 0
-                status_byte_19 = data[19] if len(data) > 19 else 0
-                result["alarm_memory_byte_value"] = alarm_memory_byte
-                result["status_byte_19"] = status_byte_19
-                result["alarm_memory"] = alarm_memory_byte == 0x02
-                result["alarm"] = bool(status_byte_19 & 0x02)
-
-                # Diagnostic INFO log — keep on while we collect more data
-                # (partial-arm states still unknown).
-                _LOGGER.info(
-                    "STATUS armed=0x%02x byte19=0x%02x mem=0x%02x siren=0x%02x raw=%s",
-                    armed_byte,
-                    status_byte_19,
-                    alarm_memory_byte,
-                    data[28] if len(data) > 28 else 0,
-                    data.hex(),
-                )
-
-                # Extract firmware version from bytes 26-27
-                if len(data) > 27:
-                    fw_byte1 = data[26]
-                    fw_byte2 = data[27]
-                    firmware_version = None  # Initialize variable to avoid UnboundLocalError
-
-                    if 16 <= fw_byte1 <= 25 and 1 <= fw_byte2 <= 10:
-                        major = fw_byte1 - 17
-                        minor = fw_byte2 - 1
-                        if 0 <= major <= 9 and 0 <= minor <= 9:
-                            firmware_version = f"{major}.{minor}.0"
-
-                    # Fallback: Show raw bytes for debugging
-                    if not firmware_version:
-                        firmware_version = f"raw_{fw_byte1:02x}_{fw_byte2:02x}"
-
-                    result["firmware_version"] = firmware_version
-
-                # Extract source voltage from bytes 20-21
-                if len(data) > 21:
-                    source_raw = (data[20] << 8) | data[21]
-
-                    if source_raw == 0 or source_raw < 100:
-                        source_voltage = 0.0
-                    else:
-                        # Standard voltage offset for panel ADC calibration
-                        source_voltage = (source_raw + 500) / 100.0
-
-                        # Validate range (typical mains voltage 12-16V)
-                        if source_voltage < 5.0 or source_voltage > 20.0:
-                            _LOGGER.warning("Source voltage %.2fV seems out of range", source_voltage)
-
-                    result["source_voltage"] = source_voltage
-
-                # Extract battery voltage from bytes 22-23
-                if len(data) > 23:
-                    battery_raw = (data[22] << 8) | data[23]
-
-                    if battery_raw == 0 or battery_raw < 100:
-                        battery_voltage = None  # Battery missing/disconnected
-                    else:
-                        # Standard voltage offset for panel ADC calibration
-                        battery_voltage = (battery_raw + 500) / 100.0
-
-                        # Validate range (typical battery voltage 10-16V)
-                        if battery_voltage < 5.0 or battery_voltage > 20.0:
-                            _LOGGER.warning("Battery voltage %.2fV seems out of range", battery_voltage)
-
-                    result["battery_voltage"] = battery_voltage
-
-                # Extract siren status from byte 28
-                if len(data) > 28:
-                    siren_byte = data[28]
-
-                    # Common patterns observed
-                    known_off_values = [0x11, 0x19, 0x01, 0x00, 0x07, 0x08, 0x10, 0x18]
-                    known_on_values = [0xFF, 0x80, 0x40, 0x20, 0xF0, 0xF8]
-
-                    if siren_byte in known_off_values:
-                        siren_status = "Off"
-                    elif siren_byte in known_on_values:
-                        siren_status = "On"
-                    elif siren_byte & 0xF0 == 0x10:  # 0x1X pattern
-                        siren_status = "Off"
-                    elif siren_byte > 0x80:  # High values typically On
-                        siren_status = "On"
-                    elif siren_byte < 0x20:  # Low values typically Off
-                        siren_status = "Off"
-                    else:
-                        # Default to Off for unknown patterns
-                        siren_status = "Off"
-
-                    result["siren_status"] = siren_status
-                    result["siren_byte_debug"] = siren_byte
-
-                # Determine battery status intelligently
-                # Primary: Use battery voltage reading (most reliable)
-                # Secondary: Check byte 29 for additional confirmation
-                battery_missing = False
-                if result.get("battery_voltage") is None:
-                    # No battery voltage detected = battery missing
-                    battery_missing = True
-                else:
-                    # Battery voltage detected = battery present
-                    battery_missing = False
-
-                # Additional debugging for byte 29 patterns (only log when needed for troubleshooting)
-                if len(data) > 29:
-                    battery_byte = data[29]
-                    result["battery_status_byte_debug"] = battery_byte
-
-                result["battery_missing"] = battery_missing
-
-                # PGM status - use persistent state tracking (only 2 PGMs)
-                pgm_statuses = []
-                for pgm_id in range(1, 3):  # Only PGM 1-2 as per Android app
-                    pgm_statuses.append(
-                        {
-                            "id": pgm_id,
-                            "name": f"PGM {pgm_id}",
-                            "active": False,  # Updated by connector's persistent state
-                        }
-                    )
-
-                result["pgm_statuses"] = pgm_statuses
-            else:
-                # Simple status response (7 bytes) - no armed state info
-                result["authenticated"] = False
+        if len(data) < 32:
+            # Simple status response (7 bytes) or malformed/short response -
+            # no armed state info
+            return result
+
+        # Extract armed state from byte 6 (0-based indexing)
+        armed_byte = data[NATIVE_STATUS_ARMED_BYTE]
+        result["armed"] = armed_byte == NATIVE_STATUS_ARMED
+        result["armed_byte_value"] = armed_byte
+        result["authenticated"] = True
+        # Byte 8 = alarm-memory latch (0x00 normally, 0x02 once an
+        # alarm has occurred). It survives disarm and re-arm, so it's
+        # NOT a live-siren signal — only useful for "an alarm happened
+        # recently" indicator.
+        # Byte 19 bit 1 (0x02) IS the live siren-active flag: it goes
+        # high while the siren is actually sounding and clears within
+        # a few seconds of disarm.
+        # Bit map of byte 19 observed on AMT 1016 NET (2026-04-27):
+        #   0x01 — always 1 (status frame marker?)
+        #   0x02 — siren currently active
+        #   0x08 — currently armed
+        #   0x10 — always 1 (status frame marker?)
+        #   other bits — unknown
+        alarm_memory_byte = data[8]
+        (
+            status_byte_19,
+            source_raw,
+            battery_raw,
+            fw_byte1,
+            fw_byte2,
+            siren_byte,
+            battery_byte,
+        ) = _STATUS_FIELDS.unpack_from(data, 19)
+        result["alarm_memory_byte_value"] = alarm_memory_byte
+        result["status_byte_19"] = status_byte_19
+        result["alarm_memory"] = alarm_memory_byte == 0x02
+        result["alarm"] = bool(status_byte_19 & 0x02)
+
+        # Diagnostic INFO log — keep on while we collect more data
+        # (partial-arm states still unknown).
+        _LOGGER.info(
+            "STATUS armed=0x%02x byte19=0x%02x mem=0x%02x siren=0x%02x raw=%s",
+            armed_byte,
+            status_byte_19,
+            alarm_memory_byte,
+            siren_byte,
+            result["raw_response"],
+        )
+
+        # Firmware version from bytes 26-27
+        # Fallback: Show raw bytes for debugging
+        firmware_version = _FIRMWARE_VERSIONS.get((fw_byte1 << 8) | fw_byte2)
+        result["firmware_version"] = firmware_version or f"raw_{fw_byte1:02x}_{fw_byte2:02x}"
+
+        # Source voltage from bytes 20-21
+        if source_raw == 0 or source_raw < 100:
+            source_voltage = 0.0
+        else:
+            # Standard voltage offset for panel ADC calibration
+            source_voltage = (source_raw + 500) / 100.0
+
+            # Validate range (typical mains voltage 12-16V)
+            if source_voltage < 5.0 or source_voltage > 20.0:
+                _LOGGER.warning("Source voltage %.2fV seems out of range", source_voltage)
+
+        result["source_voltage"] = source_voltage
+
+        # Battery voltage from bytes 22-23
+        if battery_raw == 0 or battery_raw < 100:
+            battery_voltage = None  # Battery missing/disconnected
+        else:
+            # Standard voltage offset for panel ADC calibration
+            battery_voltage = (battery_raw + 500) / 100.0
+
+            # Validate range (typical battery voltage 10-16V)
+            if battery_voltage < 5.0 or battery_voltage > 20.0:
+                _LOGGER.warning("Battery voltage %.2fV seems out of range", battery_voltage)
+
+        result["battery_voltage"] = battery_voltage
+        # No battery voltage detected = battery missing
+        result["battery_missing"] = battery_voltage is None
+
+        # Siren status from byte 28
+        result["siren_status"] = _SIREN_STATUS_TABLE[siren_byte]
+        result["siren_byte_debug"] = siren_byte
+
+        # Additional debugging for byte 29 patterns (only log when needed for troubleshooting)
+        result["battery_status_byte_debug"] = battery_byte
+
+        # PGM status - use persistent state tracking (only 2 PGMs)
+        pgm_statuses = []
+        for pgm_id in range(1, 3):  # Only PGM 1-2 as per Android app
+            pgm_statuses.append(
+                {
+                    "id": pgm_id,
+                    "name": f"PGM {pgm_id}",
+                    "active": False,  # Updated by connector's persistent state
+                }
+            )
+
+        result["pgm_statuses"] = pgm_statuses
 
         return result
 
@@ -395,30 +389,34 @@ class IntelbrasNativeProtocol:
             "command_type": command_type,
         }
 
-        if command_type == "pgm" and len(data) > NATIVE_PGM_STATE_BYTE:
-            # Extract PGM state from response
-            state_byte = data[NATIVE_PGM_STATE_BYTE]
-            result["pgm_state_byte"] = state_byte
+        if command_type != "pgm" or len(data) <= NATIVE_PGM_STATE_BYTE:
+            return result
 
-            # Check if response indicates PGM is ON or OFF
-            pgm_on = state_byte in NATIVE_PGM_ON_VALUES
-            result["pgm_on"] = pgm_on
+        # Extract PGM state from response
+        state_byte = data[NATIVE_PGM_STATE_BYTE]
+        result["pgm_state_byte"] = state_byte
+
+        # Check if response indicates PGM is ON or OFF
+        result["pgm_on"] = state_byte in NATIVE_PGM_ON_VALUES
 
         return result
 
     @staticmethod
+    @cache
     def build_mac_address_request() -> bytes:
         """Build MAC address request packet."""
-        data = [
-            NATIVE_PROTOCOL_ID,
-            0x04,  # Subtype for device info
-            0x12,  # Command for MAC/device info
-            0x06,
-            0xF0,
-            0x06,
-            0xC9,
-            0x85,
-        ]
+        data = bytes(
+            (
+                NATIVE_PROTOCOL_ID,
+                0x04,  # Subtype for device info
+                0x12,  # Command for MAC/device info
+                0x06,
+                0xF0,
+                0x06,
+                0xC9,
+                0x85,
+            )
+        )
         return IntelbrasNativeProtocol._build_packet(data)
 
     @staticmethod
@@ -432,19 +430,27 @@ class IntelbrasNativeProtocol:
 
         # MAC address is at bytes 4-9
         if len(data) >= 10:
-            mac_bytes = data[4:10]
-            result["mac_address"] = ":".join([f"{b:02X}" for b in mac_bytes])
+            result["mac_address"] = memoryview(data)[4:10].hex(":").upper()
             _LOGGER.debug("Extracted MAC address: %s", result["mac_address"])
 
         return result
 
     @staticmethod
-    def _build_packet(data: list[int]) -> bytes:
+    def _build_packet(data: bytes) -> bytes:
         """Build complete packet with length and checksum."""
+        # Single buffer: [length][payload][checksum]
         length = len(data)
-        packet_without_checksum = [length] + data
-        checksum = IntelbrasNativeProtocol.calculate_checksum(packet_without_checksum)
-        return bytes(packet_without_checksum + [checksum])
+        packet = bytearray(length + 2)
+        packet[0] = length
+        packet[1:-1] = data
+        packet[-1] = IntelbrasNativeProtocol.calculate_checksum(memoryview(packet)[:-1])
+        return bytes(packet)
+
+
+# Fixed part of each PGM status entry; only PGM 1-2 as shown in Android app
+_PGM_STATUS_TEMPLATES: tuple[dict[str, Any], ...] = tuple(
+    {"id": pgm_id, "name": f"PGM {pgm_id}"} for pgm_id in range(1, 3)
+)
 
 
 class IntelbrasConnector:
@@ -462,6 +468,8 @@ class IntelbrasConnector:
         self._is_connected = False
         self._is_authenticated = False
         self.last_status: dict[str, Any] = {}
+        # Monotonic time of the last successful status poll
+        self._last_status_time = 0.0
 
         # Concurrency control and error tracking
         self._connection_lock = asyncio.Lock()
@@ -472,6 +480,15 @@ class IntelbrasConnector:
         # PGM state persistence - maintain states between status updates (only 2 PGMs)
         self._pgm_states = {1: False, 2: False}  # Only PGM 1-2 as per Android app
 
+        # Authentication packet, built once from the configured password
+        self._auth_packet: bytes | None = None
+
+    def _prepare_auth(self, password: str) -> bytes:
+        """Return the authentication packet, building it on first use."""
+        if self._auth_packet is None:
+            self._auth_packet = IntelbrasNativeProtocol.build_authentication(password)
+        return self._auth_packet
+
     def _is_connection_alive(self) -> bool:
         """Check if the persistent connection is still usable."""
         if not self._is_connected or not self._is_authenticated:
@@ -499,10 +516,14 @@ class IntelbrasConnector:
             return False
         return True
 
-    async def _ensure_connected(self) -> bool:
-        """Ensure we have a live, authenticated connection. Reconnect if needed."""
+    async def _ensure_connected(self) -> None:
+        """Ensure we have a live, authenticated connection. Reconnect if needed.
+
+        Raises IntelbrasFatalError for configuration problems and
+        IntelbrasTransientError when the panel cannot be reached.
+        """
         if self._is_connection_alive():
-            return True
+            return
 
         _LOGGER.info("Connection not alive, reconnecting...")
         await self._cleanup_connection()
@@ -513,13 +534,16 @@ class IntelbrasConnector:
 
         if not password:
             self._last_connection_error = "No password configured"
-            return False
+            raise IntelbrasFatalError("No password configured")
 
         try:
+            # Encode the password before touching the network so the auth
+            # packet is ready as soon as the handshake completes
+            auth_packet = self._prepare_auth(password)
+
             # 1. Open TCP connection
-            self.reader, self.writer = await asyncio.wait_for(
-                asyncio.open_connection(ip, port), timeout=10
-            )
+            async with asyncio.timeout(10):
+                self.reader, self.writer = await asyncio.open_connection(ip, port)
 
             # 2. Enable TCP keepalive on the underlying socket
             sock = self.writer.get_extra_info("socket")
@@ -538,8 +562,9 @@ class IntelbrasConnector:
             self.writer.write(packet)
             await self.writer.drain()
 
-            response = await asyncio.wait_for(self.reader.read(1024), timeout=8)
-            if not response or len(response) < 7:
+            async with asyncio.timeout(8):
+                response = await self.reader.read(1024)
+            if len(response) < 7:
                 raise ConnectionError("Initial status handshake failed")
 
             self._is_connected = True
@@ -547,12 +572,12 @@ class IntelbrasConnector:
             # 4. Authenticate
             await asyncio.sleep(0.5)  # Panel stability delay
 
-            auth_packet = IntelbrasNativeProtocol.build_authentication(password)
             self.writer.write(auth_packet)
             await self.writer.drain()
 
-            auth_response = await asyncio.wait_for(self.reader.read(1024), timeout=8)
-            if not auth_response or len(auth_response) < 5:
+            async with asyncio.timeout(8):
+                auth_response = await self.reader.read(1024)
+            if len(auth_response) < 5:
                 raise ConnectionError("Authentication failed - invalid response")
 
             await asyncio.sleep(0.3)  # Post-auth stability delay
@@ -562,7 +587,6 @@ class IntelbrasConnector:
             self._edit_mode_detected = False
             self._consecutive_failures = 0
             _LOGGER.info("Connected and authenticated to panel at %s:%s", ip, port)
-            return True
 
         except Exception as ex:
             self._last_connection_error = str(ex)
@@ -570,40 +594,51 @@ class IntelbrasConnector:
                 self._edit_mode_detected = True
             _LOGGER.error("Failed to connect: %s", ex)
             await self._cleanup_connection()
-            return False
+            if isinstance(ex, IntelbrasError):
+                raise
+            raise IntelbrasTransientError(f"Connection failed: {ex}") from ex
 
-    async def _send_and_receive(self, packet: bytes, timeout: float = 10) -> bytes | None:
+    def _open_writer(self) -> asyncio.StreamWriter:
+        """Return the connection's writer, raising if it has been closed."""
+        if not self.writer or self.writer.is_closing():
+            raise ConnectionError("Writer is closed")
+        return self.writer
+
+    async def _send_and_receive(self, packet: bytes, timeout: float = 10) -> bytes:
         """Send a packet and read the response on the persistent connection.
 
         If the send/receive fails, marks the connection as dead so the next
         call to _ensure_connected will reconnect.
         """
         try:
-            if not self.writer or self.writer.is_closing():
-                raise ConnectionError("Writer is closed")
-
-            self.writer.write(packet)
-            await self.writer.drain()
+            writer = self._open_writer()
+            writer.write(packet)
+            await writer.drain()
 
-            response = await asyncio.wait_for(self.reader.read(1024), timeout=timeout)
-            if not response:
-                raise ConnectionError("Empty response")
-
-            self._consecutive_failures = 0
-            return response
+            async with asyncio.timeout(timeout):
+                response = await self.reader.read(1024)
+            if response:
+                self._consecutive_failures = 0
+                return response
+            raise ConnectionError("Empty response")
 
         except Exception as ex:
-            _LOGGER.warning("Send/receive failed, will reconnect: %s", ex)
-            self._consecutive_failures += 1
-            await self._cleanup_connection()
+            await self._drop_connection(ex)
+            if isinstance(ex, (asyncio.TimeoutError, OSError)):
+                raise IntelbrasTransientError(f"Send/receive failed: {ex}") from ex
             raise
 
+    async def _drop_connection(self, ex: Exception) -> None:
+        """Record a failed exchange and close the connection (cold path)."""
+        _LOGGER.warning("Send/receive failed, will reconnect: %s", ex)
+        self._consecutive_failures += 1
+        await self._cleanup_connection()
+
     async def async_get_status(self) -> dict[str, Any]:
         """Get current panel status."""
         async with self._connection_lock:
             try:
-                if not await self._ensure_connected():
-                    return self._get_disconnected_status("Connection failed")
+                await self._ensure_connected()
 
                 packet = IntelbrasNativeProtocol.build_authenticated_status()
                 response = await self._send_and_receive(packet, timeout=10)
@@ -627,18 +662,28 @@ class IntelbrasConnector:
                     "native_response": parsed,
                 }
 
+                self._last_status_time = time.monotonic()
+
+                # Hand back the previous object when nothing changed so callers
+                # can detect an unchanged status by identity
+                if status == self.last_status:
+                    return self.last_status
+
                 self.last_status = status
                 return status
 
             except Exception as ex:
-                _LOGGER.error("Failed to get status: %s", ex)
-                return self._get_disconnected_status(f"Communication error: {ex}")
+                return self._handle_status_failure(ex)
+
+    def _handle_status_failure(self, ex: Exception) -> dict[str, Any]:
+        """Log a failed status poll and return the disconnected status (cold path)."""
+        _LOGGER.error("Failed to get status: %s", ex)
+        return self._get_disconnected_status(f"Communication error: {ex}")
 
     def _build_pgm_status(self) -> list[dict[str, Any]]:
         """Build PGM status list with persistent state - only 2 PGMs as per Android app."""
         return [
-            {"id": pgm_id, "name": f"PGM {pgm_id}", "active": self._pgm_states.get(pgm_id, False)}
-            for pgm_id in range(1, 3)  # Only PGM 1-2 as shown in Android app
+            {**template, "active": self._pgm_states.get(template["id"], False)} for template in _PGM_STATUS_TEMPLATES
         ]
 
     def _get_disconnected_status(self, reason: str) -> dict[str, Any]:
@@ -661,12 +706,24 @@ class IntelbrasConnector:
         self.last_status = status
         return status
 
+    async def _async_get_current_status(self) -> dict[str, Any]:
+        """Return the status to base an arm/disarm toggle on.
+
+        Reuses the last poll if it is only a moment old, otherwise polls the
+        panel. The age limit is kept short since the toggle direction depends
+        on it.
+        """
+        if self.last_status.get("connected") and time.monotonic() - self._last_status_time < ARM_STATUS_MAX_AGE:
+            return self.last_status
+
+        status = await self.async_get_status()
+        if not status.get("connected", False):
+            raise IntelbrasTransientError(status.get("connection_error", "Panel not connected"))
+        return status
+
     async def async_arm(self, partition: int = 1, stay_arm: bool = False) -> bool:
         """Arm the system."""
-        current_status = await self.async_get_status()
-        if not current_status.get("connected", False):
-            return False
-
+        current_status = await self._async_get_current_status()
         if current_status.get("armed", False):
             return True
 
@@ -674,57 +731,49 @@ class IntelbrasConnector:
 
     async def async_disarm(self, partition: int = 1) -> bool:
         """Disarm the system."""
-        current_status = await self.async_get_status()
-        if not current_status.get("connected", False):
-            return False
-
+        current_status = await self._async_get_current_status()
         if not current_status.get("armed", False):
             return True
 
         return await self._send_arm_disarm_toggle("disarm")
 
     async def _send_arm_disarm_toggle(self, action: str) -> bool:
-        """Send arm/disarm toggle command."""
-        async with self._connection_lock:
-            try:
-                if not await self._ensure_connected():
-                    return False
+        """Send arm/disarm toggle command.
 
-                packet = IntelbrasNativeProtocol.build_arm_disarm_toggle()
-                response = await self._send_and_receive(packet, timeout=DEFAULT_TIMEOUT)
+        Connection and protocol errors propagate as IntelbrasTransientError or
+        IntelbrasFatalError so the caller can decide whether to retry.
+        """
+        packet = IntelbrasNativeProtocol.build_arm_disarm_toggle()
 
-                if response:
-                    parsed = IntelbrasNativeProtocol.parse_control_response(response, "arm_disarm")
-                    return parsed["success"]
-                return False
+        async with self._connection_lock:
+            await self._ensure_connected()
+            # The toggle may reach the panel even if the reply fails, so the
+            # cached status can no longer pick the next toggle direction
+            self._last_status_time = 0.0
+            response = await self._send_and_receive(packet, timeout=DEFAULT_TIMEOUT)
 
-            except Exception as ex:
-                _LOGGER.error("Failed to %s: %s", action, ex)
-                return False
+        # _send_and_receive raises on an empty response
+        return IntelbrasNativeProtocol.parse_control_response(response, "arm_disarm")["success"]
 
     async def async_set_pgm(self, pgm_id: int, state: bool) -> bool:
-        """Toggle PGM output."""
-        async with self._connection_lock:
-            try:
-                if not await self._ensure_connected():
-                    return False
+        """Toggle PGM output.
 
-                packet = IntelbrasNativeProtocol.build_pgm_toggle(pgm_id)
-                response = await self._send_and_receive(packet, timeout=DEFAULT_TIMEOUT)
+        Raises IntelbrasFatalError for an unknown PGM before touching the
+        network, and IntelbrasTransientError for connection failures.
+        """
+        packet = IntelbrasNativeProtocol.build_pgm_toggle(pgm_id)
 
-                if response:
-                    parsed = IntelbrasNativeProtocol.parse_control_response(response, "pgm")
-                    success = parsed["success"]
+        async with self._connection_lock:
+            await self._ensure_connected()
+            response = await self._send_and_receive(packet, timeout=DEFAULT_TIMEOUT)
 
-                    if success and 1 <= pgm_id <= 2:
-                        self._pgm_states[pgm_id] = not self._pgm_states.get(pgm_id, False)
+            # _send_and_receive raises on an empty response
+            success = IntelbrasNativeProtocol.parse_control_response(response, "pgm")["success"]
 
-                    return success
-                return False
+            if success and 1 <= pgm_id <= 2:
+                self._pgm_states[pgm_id] = not self._pgm_states.get(pgm_id, False)
 
-            except Exception as ex:
-                _LOGGER.error("Failed to toggle PGM %s: %s", pgm_id, ex)
-                return False
+        return success
 
     async def async_trigger_pgm(self, pgm_id: int, action: str = "toggle") -> bool:
         """Trigger PGM (works as toggle)."""
@@ -836,4 +885,4 @@ class IntelbrasConnector:
         if not (1 <= pgm_id <= 2):  # Only PGM 1-2 supported
             return None
 
-        return {"id": pgm_id, "name": f"PGM {pgm_id}", "active": self._pgm_states.get(pgm_id, False)}
+        return {**_PGM_STATUS_TEMPLATES[pgm_id - 1], "active": self._pgm_states.get(pgm_id, False)}
@@ -13,11 +13,11 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, DEFAULT_SCAN_INTERVAL
+from .const import DOMAIN
 from .coordinator import IntelbrasAlarmCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -52,21 +52,42 @@ class IntelbrasBaseSensor(CoordinatorEntity, SensorEntity):
     """Base class for Intelbras sensors."""
 
     _attr_has_entity_name = True
+    # Whether the entity shows poll times and so must update on every poll,
+    # not only when the panel status changes
+    _update_every_poll = False
 
     def __init__(self, coordinator: IntelbrasAlarmCoordinator) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.coordinator: IntelbrasAlarmCoordinator = coordinator
         self._attr_device_info = coordinator.device_info
+        self._update_from_coordinator()
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to every poll when the entity shows poll times."""
+        await super().async_added_to_hass()
+        if self._update_every_poll:
+            self.async_on_remove(self.coordinator.async_add_poll_listener(self._handle_coordinator_update))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached state before writing it."""
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
+
+    def _update_from_coordinator(self) -> None:
+        """Cache availability from the latest coordinator data."""
+        status = self.coordinator.get_status()
+        # Entity is unavailable when connection is disabled
+        self._attr_available = bool(
+            self.coordinator.last_update_success and status is not None and not status.get("connection_disabled", False)
+        )
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        # Entity is unavailable when connection is disabled
-        if self.coordinator.data and self.coordinator.data.get("status", {}).get("connection_disabled", False):
-            return False
-
-        return self.coordinator.last_update_success and self.coordinator.data is not None
+        # CoordinatorEntity overrides available, so expose the cached flag
+        return self._attr_available
 
 
 class IntelbrasLastUpdateSensor(IntelbrasBaseSensor):
@@ -79,14 +100,19 @@ class IntelbrasLastUpdateSensor(IntelbrasBaseSensor):
     _attr_name = "Last Update"
 
     _attr_should_poll = False
-    _attr_available = True
+    _update_every_poll = True
 
     def __init__(self, coordinator: IntelbrasAlarmCoordinator) -> None:
         """Initialize the last update sensor."""
         super().__init__(coordinator)
 
-        device_id = list(coordinator.device_identifiers)[0][1]
-        self._attr_unique_id = f"{device_id}_last_update"
+        self._attr_unique_id = coordinator.entity_unique_id("last_update")
+
+        # Attributes that never change for this entry
+        self._static_attributes = {
+            "panel_ip": coordinator.panel_ip,
+            "integration_version": "native_protocol_v1.0",
+        }
 
     @property
     def native_value(self) -> datetime | None:
@@ -98,9 +124,8 @@ class IntelbrasLastUpdateSensor(IntelbrasBaseSensor):
         """Return diagnostic attributes."""
         return {
             "update_success": self.coordinator.last_update_success,
-            "update_interval_seconds": DEFAULT_SCAN_INTERVAL,
-            "panel_ip": self.coordinator.panel_ip,
-            "integration_version": "native_protocol_v1.0",
+            "update_interval_seconds": self.coordinator.update_interval.total_seconds(),
+            **self._static_attributes,
         }
 
 
@@ -111,47 +136,45 @@ class IntelbrasSystemStatusSensor(IntelbrasBaseSensor):
         """Initialize the system status sensor."""
         super().__init__(coordinator)
 
-        device_id = list(coordinator.device_identifiers)[0][1]
-        self._attr_unique_id = f"{device_id}_system_status"
+        self._attr_unique_id = coordinator.entity_unique_id("system_status")
         self._attr_name = "System Status"
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the native value of the sensor."""
-        if not self.coordinator.data or "status" not in self.coordinator.data:
-            return "unknown"
-
-        status = self.coordinator.data["status"]
-
-        if status.get("alarm", False):
-            return "Alarm"
-        elif status.get("armed", False):
-            return "Armed Away"
-        elif status.get("partial_armed", False):
-            return "Armed Home"
-        else:
-            return "Disarmed"
+    def _update_from_coordinator(self) -> None:
+        """Cache the status label and attributes from the latest coordinator data.
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes.
-
-        Includes the raw protocol bytes that drive the parser, so users can
-        inspect them via the HA API while the alarm is in different states
-        (disarmed / armed / triggered) and identify the bit/byte that encodes
-        triggered. Once the triggered byte pattern is known, the parser can be
-        extended to set status['alarm'] correctly.
+        The attributes include the raw protocol bytes that drive the parser,
+        so users can inspect them via the HA API while the alarm is in
+        different states (disarmed / armed / triggered) and identify the
+        bit/byte that encodes triggered. Once the triggered byte pattern is
+        known, the parser can be extended to set status['alarm'] correctly.
         """
-        if not self.coordinator.data or "status" not in self.coordinator.data:
-            return {}
+        super()._update_from_coordinator()
+
+        status = self.coordinator.get_status()
+        if status is None:
+            self._attr_native_value = "unknown"
+            self._attr_extra_state_attributes = {}
+            return
+
+        alarm = status.get("alarm", False)
+        armed = status.get("armed", False)
+        partial_armed = status.get("partial_armed", False)
+
+        if alarm:
+            self._attr_native_value = "Alarm"
+        elif armed:
+            self._attr_native_value = "Armed Away"
+        elif partial_armed:
+            self._attr_native_value = "Armed Home"
+        else:
+            self._attr_native_value = "Disarmed"
 
-        status = self.coordinator.data["status"]
         native = status.get("native_response", {}) or {}
 
-        return {
-            "armed": status.get("armed", False),
-            "partial_armed": status.get("partial_armed", False),
-            "alarm": status.get("alarm", False),
+        self._attr_extra_state_attributes = {
+            "armed": armed,
+            "partial_armed": partial_armed,
+            "alarm": alarm,
             "pgms_count": len(status.get("pgms", [])),
             # Diagnostic — raw bytes from the protocol response. byte 6 = armed
             # state byte, byte 28 = siren byte. Capture these in different
@@ -163,7 +186,26 @@ class IntelbrasSystemStatusSensor(IntelbrasBaseSensor):
         }
 
 
-class IntelbrasSourceVoltageSensor(IntelbrasBaseSensor):
+class IntelbrasPanelSensor(IntelbrasBaseSensor):
+    """Base class for panel readings that expose the last update and panel info."""
+
+    _update_every_poll = True
+
+    def _update_from_coordinator(self) -> None:
+        """Cache availability and the shared attributes from the latest coordinator data."""
+        super()._update_from_coordinator()
+
+        if self.coordinator.get_status() is None:
+            self._attr_extra_state_attributes = {}
+            return
+
+        self._attr_extra_state_attributes = {
+            "last_updated": self.coordinator.last_successful_update_time,
+            "panel_info": self.coordinator.panel_info,
+        }
+
+
+class IntelbrasSourceVoltageSensor(IntelbrasPanelSensor):
     """Sensor for panel source voltage."""
 
     _attr_device_class = SensorDeviceClass.VOLTAGE
@@ -176,34 +218,22 @@ class IntelbrasSourceVoltageSensor(IntelbrasBaseSensor):
         """Initialize the source voltage sensor."""
         super().__init__(coordinator)
 
-        device_id = list(coordinator.device_identifiers)[0][1]
-        self._attr_unique_id = f"{device_id}_source_voltage"
+        self._attr_unique_id = coordinator.entity_unique_id("source_voltage")
         self._attr_name = "Source Voltage"
 
     @property
     def native_value(self) -> float | None:
         """Return the source voltage."""
-        if not self.coordinator.data or "status" not in self.coordinator.data:
+        status = self.coordinator.get_status()
+        if status is None:
             return None
 
-        status = self.coordinator.data["status"]
         voltage = status.get("source_voltage")
 
         return voltage if voltage is not None else None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        if not self.coordinator.data or "status" not in self.coordinator.data:
-            return {}
-
-        return {
-            "last_updated": self.coordinator.last_successful_update_time,
-            "panel_info": self.coordinator.panel_info,
-        }
-
 
-class IntelbrasSirenStatusSensor(IntelbrasBaseSensor):
+class IntelbrasSirenStatusSensor(IntelbrasPanelSensor):
     """Sensor for siren status."""
 
     _attr_entity_category = EntityCategory.DIAGNOSTIC
@@ -212,41 +242,30 @@ class IntelbrasSirenStatusSensor(IntelbrasBaseSensor):
         """Initialize the siren status sensor."""
         super().__init__(coordinator)
 
-        device_id = list(coordinator.device_identifiers)[0][1]
-        self._attr_unique_id = f"{device_id}_siren_status"
+        self._attr_unique_id = coordinator.entity_unique_id("siren_status")
         self._attr_name = "Siren Status"
 
     @property
     def native_value(self) -> str | None:
         """Return the siren status."""
-        if not self.coordinator.data or "status" not in self.coordinator.data:
+        status = self.coordinator.get_status()
+        if status is None:
             _LOGGER.debug("Siren status: No data available")
             return "Unknown"
 
-        status = self.coordinator.data["status"]
         siren_status = status.get("siren_status")
 
         # Additional debugging info from raw parsing
-        if "siren_byte_debug" in status:
-            _LOGGER.debug("Siren debug byte: 0x%02x", status["siren_byte_debug"])
-        if "siren_reason" in status:
-            _LOGGER.debug("Siren interpretation reason: %s", status["siren_reason"])
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            if "siren_byte_debug" in status:
+                _LOGGER.debug("Siren debug byte: 0x%02x", status["siren_byte_debug"])
+            if "siren_reason" in status:
+                _LOGGER.debug("Siren interpretation reason: %s", status["siren_reason"])
 
         return siren_status if siren_status is not None else "Unknown"
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        if not self.coordinator.data or "status" not in self.coordinator.data:
-            return {}
-
-        return {
-            "last_updated": self.coordinator.last_successful_update_time,
-            "panel_info": self.coordinator.panel_info,
-        }
 
-
-class IntelbrasBatteryStatusSensor(IntelbrasBaseSensor):
+class IntelbrasBatteryStatusSensor(IntelbrasPanelSensor):
     """Sensor for battery status."""
 
     _attr_entity_category = EntityCategory.DIAGNOSTIC
@@ -255,17 +274,16 @@ class IntelbrasBatteryStatusSensor(IntelbrasBaseSensor):
         """Initialize the battery status sensor."""
         super().__init__(coordinator)
 
-        device_id = list(coordinator.device_identifiers)[0][1]
-        self._attr_unique_id = f"{device_id}_battery_status"
+        self._attr_unique_id = coordinator.entity_unique_id("battery_status")
         self._attr_name = "Battery Status"
 
     @property
     def native_value(self) -> str | None:
         """Return the battery status."""
-        if not self.coordinator.data or "status" not in self.coordinator.data:
+        status = self.coordinator.get_status()
+        if status is None:
             return "Unknown"
 
-        status = self.coordinator.data["status"]
         battery_missing = status.get("battery_missing")
 
         if battery_missing is None:
@@ -275,19 +293,8 @@ class IntelbrasBatteryStatusSensor(IntelbrasBaseSensor):
         else:
             return "Present"
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        if not self.coordinator.data or "status" not in self.coordinator.data:
-            return {}
-
-        return {
-            "last_updated": self.coordinator.last_successful_update_time,
-            "panel_info": self.coordinator.panel_info,
-        }
-
 
-class IntelbrasBatteryVoltageSensor(IntelbrasBaseSensor):
+class IntelbrasBatteryVoltageSensor(IntelbrasPanelSensor):
     """Sensor for panel battery voltage."""
 
     _attr_device_class = SensorDeviceClass.VOLTAGE
@@ -300,28 +307,16 @@ class IntelbrasBatteryVoltageSensor(IntelbrasBaseSensor):
         """Initialize the battery voltage sensor."""
         super().__init__(coordinator)
 
-        device_id = list(coordinator.device_identifiers)[0][1]
-        self._attr_unique_id = f"{device_id}_battery_voltage"
+        self._attr_unique_id = coordinator.entity_unique_id("battery_voltage")
         self._attr_name = "Battery Voltage"
 
     @property
     def native_value(self) -> float | None:
         """Return the battery voltage."""
-        if not self.coordinator.data or "status" not in self.coordinator.data:
+        status = self.coordinator.get_status()
+        if status is None:
             return None
 
-        status = self.coordinator.data["status"]
         battery_voltage = status.get("battery_voltage")
 
         return battery_voltage if battery_voltage is not None else None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        if not self.coordinator.data or "status" not in self.coordinator.data:
-            return {}
-
-        return {
-            "last_updated": self.coordinator.last_successful_update_time,
-            "panel_info": self.coordinator.panel_info,
-        }
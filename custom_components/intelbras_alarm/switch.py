@@ -4,12 +4,11 @@ from __future__ import annotations
 
 import logging
 from typing import Any
-import asyncio
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -18,6 +17,9 @@ from .coordinator import IntelbrasAlarmCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# PGM outputs the panel can address
+_VALID_PGM_IDS: frozenset[int] = frozenset({1, 2, 3, 4})
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -34,7 +36,7 @@ async def async_setup_entry(
     available_pgms = []
     if coordinator.data and "status" in coordinator.data:
         pgms = coordinator.data["status"].get("pgms", [])
-        available_pgms = [pgm["id"] for pgm in pgms if pgm.get("id") and 1 <= pgm["id"] <= 4]
+        available_pgms = [pgm_id for pgm in pgms if (pgm_id := pgm.get("id")) in _VALID_PGM_IDS]
         _LOGGER.info("Discovered %d PGMs from panel: %s", len(available_pgms), available_pgms)
 
     for pgm_id in available_pgms:
@@ -55,8 +57,7 @@ class IntelbrasPGMSwitch(CoordinatorEntity, SwitchEntity):
         self.coordinator: IntelbrasAlarmCoordinator = coordinator
         self.pgm_id = pgm_id
 
-        device_id = list(coordinator.device_identifiers)[0][1]
-        self._attr_unique_id = f"{device_id}_pgm_{pgm_id}"
+        self._attr_unique_id = coordinator.entity_unique_id(f"pgm_{pgm_id}")
 
         # Get PGM name from data
         pgm_name = self._get_pgm_name()
@@ -65,6 +66,8 @@ class IntelbrasPGMSwitch(CoordinatorEntity, SwitchEntity):
         # Set device info
         self._attr_device_info = coordinator.device_info
 
+        self._update_from_coordinator()
+
     def _get_pgm_name(self) -> str:
         """Get the PGM name from coordinator data."""
         pgm_status = self.coordinator.get_pgm_status(self.pgm_id)
@@ -72,92 +75,59 @@ class IntelbrasPGMSwitch(CoordinatorEntity, SwitchEntity):
             return pgm_status.get("name", f"PGM {self.pgm_id}")
         return f"PGM {self.pgm_id}"
 
-    @property
-    def is_on(self) -> bool:
-        """Return True if PGM is active."""
-        # Return False when connection is disabled (can't know real state)
-        if self.coordinator.data and self.coordinator.data.get("status", {}).get("connection_disabled", False):
-            return False
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn the PGM on."""
+        await self._async_set_pgm(True)
 
-        pgm_status = self.coordinator.get_pgm_status(self.pgm_id)
-        if not pgm_status:
-            return False
-        return pgm_status.get("active", False)
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn the PGM off."""
+        await self._async_set_pgm(False)
+
+    async def _async_set_pgm(self, state: bool) -> None:
+        """Set the PGM; the coordinator retries connection errors with backoff."""
+        action = "on" if state else "off"
+        _LOGGER.debug("Turning %s PGM %s", action, self.pgm_id)
+
+        if await self.coordinator.async_set_pgm(self.pgm_id, state):
+            _LOGGER.debug("PGM %s turned %s successfully", self.pgm_id, action)
+        else:
+            _LOGGER.error("Failed to turn %s PGM %s", action, self.pgm_id)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached state before writing it."""
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
+
+    def _update_from_coordinator(self) -> None:
+        """Cache availability, state and attributes from the latest coordinator data."""
+        status = self.coordinator.get_status()
+        connection_disabled = status is not None and status.get("connection_disabled", False)
+        # Entity is unavailable when connection is disabled
+        self._attr_available = bool(
+            self.coordinator.last_update_success and status is not None and not connection_disabled
+        )
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
         pgm_status = self.coordinator.get_pgm_status(self.pgm_id)
+        # Report off when connection is disabled (can't know real state)
+        self._attr_is_on = bool(pgm_status and not connection_disabled and pgm_status.get("active", False))
+
         if not pgm_status:
-            return {}
+            self._attr_extra_state_attributes = {}
+            return
 
-        return {
+        self._attr_extra_state_attributes = {
             "pgm_id": self.pgm_id,
             "pgm_name": pgm_status.get("name", f"PGM {self.pgm_id}"),
             "note": "PGM outputs are typically pulse/momentary - they may auto-turn off after 3-5 seconds. This is normal alarm panel behavior.",
             "output_type": "pulse/momentary",
         }
 
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn the PGM on with retry logic."""
-        _LOGGER.debug("Turning on PGM %s", self.pgm_id)
-
-        # Retry logic for more reliable PGM control
-        max_retries = 2
-        for attempt in range(max_retries + 1):
-            try:
-                success = await self.coordinator.async_set_pgm(self.pgm_id, True)
-                if success:
-                    _LOGGER.debug("PGM %s turned on successfully", self.pgm_id)
-                    return
-
-                _LOGGER.warning("PGM %s turn on failed (attempt %d/%d)", self.pgm_id, attempt + 1, max_retries + 1)
-                if attempt < max_retries:
-                    await asyncio.sleep(1)  # Wait before retry
-
-            except Exception as ex:
-                _LOGGER.warning(
-                    "PGM %s turn on error (attempt %d/%d): %s", self.pgm_id, attempt + 1, max_retries + 1, ex
-                )
-                if attempt < max_retries:
-                    await asyncio.sleep(1)
-
-        _LOGGER.error("Failed to turn on PGM %s after %d attempts", self.pgm_id, max_retries + 1)
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn the PGM off with retry logic."""
-        _LOGGER.debug("Turning off PGM %s", self.pgm_id)
-
-        # Retry logic for more reliable PGM control
-        max_retries = 2
-        for attempt in range(max_retries + 1):
-            try:
-                success = await self.coordinator.async_set_pgm(self.pgm_id, False)
-                if success:
-                    _LOGGER.debug("PGM %s turned off successfully", self.pgm_id)
-                    return
-
-                _LOGGER.warning("PGM %s turn off failed (attempt %d/%d)", self.pgm_id, attempt + 1, max_retries + 1)
-                if attempt < max_retries:
-                    await asyncio.sleep(1)  # Wait before retry
-
-            except Exception as ex:
-                _LOGGER.warning(
-                    "PGM %s turn off error (attempt %d/%d): %s", self.pgm_id, attempt + 1, max_retries + 1, ex
-                )
-                if attempt < max_retries:
-                    await asyncio.sleep(1)
-
-        _LOGGER.error("Failed to turn off PGM %s after %d attempts", self.pgm_id, max_retries + 1)
-
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        # Entity is unavailable when connection is disabled
-        if self.coordinator.data and self.coordinator.data.get("status", {}).get("connection_disabled", False):
-            return False
-
-        return self.coordinator.last_update_success and self.coordinator.data is not None
+        # CoordinatorEntity overrides available, so expose the cached flag
+        return self._attr_available
 
 
 class IntelbrasConnectionSwitch(CoordinatorEntity, SwitchEntity):
@@ -172,14 +142,9 @@ class IntelbrasConnectionSwitch(CoordinatorEntity, SwitchEntity):
         super().__init__(coordinator)
         self.coordinator: IntelbrasAlarmCoordinator = coordinator
 
-        device_id = list(coordinator.device_identifiers)[0][1]
-        self._attr_unique_id = f"{device_id}_connection_control"
+        self._attr_unique_id = coordinator.entity_unique_id("connection_control")
         self._attr_name = "Connection Control"
-
-    @property
-    def is_on(self) -> bool:
-        """Return True if connection is enabled."""
-        return getattr(self.coordinator, "_connection_enabled", True)
+        self._attr_is_on = coordinator.connection_enabled
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -194,10 +159,10 @@ class IntelbrasConnectionSwitch(CoordinatorEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable the alarm connection."""
         _LOGGER.info("Enabling alarm panel connection")
-        self.coordinator._connection_enabled = True
+        self._attr_is_on = True
 
         # Trigger immediate update when enabled
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_enable_connection()
 
         # Update the switch state
         self.async_write_ha_state()
@@ -205,10 +170,10 @@ class IntelbrasConnectionSwitch(CoordinatorEntity, SwitchEntity):
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Disable the alarm connection."""
         _LOGGER.info("Disabling alarm panel connection")
-        self.coordinator._connection_enabled = False
 
-        # Trigger immediate update to clear cached data and disconnect
-        await self.coordinator.async_request_refresh()
+        # Disconnect and clear cached data without a full refresh cycle
+        self._attr_is_on = False
+        await self.coordinator.async_disable_connection()
 
         # Update the switch state
         self.async_write_ha_state()